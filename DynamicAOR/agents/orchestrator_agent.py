@@ -1,8 +1,13 @@
 # cognisphere_adk/agents/orchestrator_agent.py
 import traceback
+from typing import Any, AsyncGenerator, Optional
 
-from google.adk.agents import Agent, LlmAgent  # LlmAgent for sub_agents and transfer
+from pydantic import PrivateAttr
+from google.adk.agents import Agent, BaseAgent, LlmAgent  # LlmAgent for sub_agents and transfer
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
 from google.adk.models.lite_llm import LiteLlm
+from google.genai import types as adk_types
 from tools.emotion_tools import analyze_emotion
 # Import new routing tools
 from tools.routing_tools import classify_and_route_query_tool, invoke_specialist_agent_tool
@@ -14,6 +19,96 @@ from callbacks.identity_handlers import (
 import app_globals  # To access the main runner for dynamic agent registration (if needed)
 import services_container  # To get agent registry
 import importlib  # For dynamic import
+import functools
+
+
+@functools.lru_cache(maxsize=256)
+def _get_creation_function(module_path, creation_function):
+    """Import a specialist's module and return its creation function, once per pair."""
+    module = importlib.import_module(module_path)
+    return getattr(module, creation_function)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_lite_llm(model_name):
+    """Return the shared LiteLlm wrapper for a model name."""
+    return LiteLlm(model=model_name)
+
+
+class LazyAgentProxy(BaseAgent):
+    """
+    Stands in for a registered specialist agent until it is first transferred to.
+
+    The proxy carries the registered name and description, which is all the
+    orchestrator needs to offer the agent for transfer_to_agent. The specialist
+    agent is created on its first run; later runs reuse it. If creating it fails,
+    the run yields an error event instead of raising into the conversation.
+
+    The proxy is not an LlmAgent, so ADK's runner does not resume follow-up turns
+    at the specialist: every turn is routed through the orchestrator again.
+    """
+    _agent_conf: Any = PrivateAttr(default=None)
+    _model_name: Optional[str] = PrivateAttr(default=None)
+    _real_agent: Optional[BaseAgent] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_config(cls, agent_conf, model_name):
+        proxy = cls(name=agent_conf.name, description=agent_conf.description)
+        proxy._agent_conf = agent_conf
+        proxy._model_name = model_name
+        return proxy
+
+    def _get_real_agent(self) -> BaseAgent:
+        if self._real_agent is None:
+            agent_conf = self._agent_conf
+            creation_func = _get_creation_function(agent_conf.module_path, agent_conf.creation_function)
+            real_agent = creation_func(model=_get_lite_llm(self._model_name))
+
+            # Override the agent's name to match the registered name if they differ,
+            # as `transfer_to_agent` uses the `agent.name`
+            if real_agent.name != agent_conf.name:
+                print(
+                    f"Warning: ADK Agent name '{real_agent.name}' differs from registered name '{agent_conf.name}'. Using registered name for transfer.")
+                real_agent.name = agent_conf.name  # Critical for transfer_to_agent by name
+
+            # Let the specialist transfer back to the orchestrator as if it were the sub-agent
+            real_agent.parent_agent = self.parent_agent
+            self._real_agent = real_agent
+            print(f"Loaded specialist agent on first use: {agent_conf.name}")
+        return self._real_agent
+
+    def _creation_error_event(self, ctx: InvocationContext, error: Exception) -> Event:
+        message = f"Specialist agent {self.name} is unavailable: {error}"
+        return Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=adk_types.Content(role="model", parts=[adk_types.Part(text=message)]),
+            error_code="AGENT_CREATION_FAILED",
+            error_message=message
+        )
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        try:
+            real_agent = self._get_real_agent()
+        except Exception as e:
+            print(f"Failed to create specialist agent {self.name}: {e}")
+            traceback.print_exc()
+            yield self._creation_error_event(ctx, e)
+            return
+        async for event in real_agent.run_async(ctx):
+            yield event
+
+    async def _run_live_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        try:
+            real_agent = self._get_real_agent()
+        except Exception as e:
+            print(f"Failed to create specialist agent {self.name}: {e}")
+            traceback.print_exc()
+            yield self._creation_error_event(ctx, e)
+            return
+        async for event in real_agent.run_live(ctx):
+            yield event
 
 
 def create_orchestrator_agent(model="openai/gpt-4o-mini",
@@ -41,7 +136,8 @@ def create_orchestrator_agent(model="openai/gpt-4o-mini",
     # to register agents at runtime.
 
     # Let's implement the "Interim Simpler Approach" first, as it's more straightforward with current ADK.
-    # We'll instantiate all registered agents here and pass them as sub_agents.
+    # Every registered agent whose module resolves is passed as a sub_agent, but through
+    # a LazyAgentProxy, so only the specialists a session actually transfers to get created.
 
     pre_loaded_specialist_agents = []
     agent_registry = services_container.get_agent_registry_service()
@@ -52,8 +148,9 @@ def create_orchestrator_agent(model="openai/gpt-4o-mini",
                 if agent_conf.name.lower() == "cognisphere_orchestrator" or agent_conf.name.lower() == "cupcake":
                     continue
 
-                module = importlib.import_module(agent_conf.module_path)
-                creation_func = getattr(module, agent_conf.creation_function)
+                # Resolve the module and creation function now (cached), so a broken
+                # registry entry is logged and skipped here rather than offered for transfer
+                _get_creation_function(agent_conf.module_path, agent_conf.creation_function)
 
                 # Determine model for the specialist agent
                 model_for_specialist = agent_conf.default_model or model  # Fallback to orchestrator's model
@@ -72,17 +169,12 @@ def create_orchestrator_agent(model="openai/gpt-4o-mini",
                 # Let's adjust RegisteredAgent to have an optional `adk_name` or ensure `name` is used for ADK.
                 # For now, let's assume agent_conf.name is the one ADK will recognize.
 
-                specialist_instance = creation_func(model=LiteLlm(model=model_for_specialist))
-
-                # Override the agent's name to match the registered name if they differ,
-                # as `transfer_to_agent` uses the `agent.name`
-                if hasattr(specialist_instance, 'name') and specialist_instance.name != agent_conf.name:
-                    print(
-                        f"Warning: ADK Agent name '{specialist_instance.name}' differs from registered name '{agent_conf.name}'. Using registered name for transfer.")
-                    specialist_instance.name = agent_conf.name  # Critical for transfer_to_agent by name
+                # A new proxy per orchestrator: ADK only lets an agent instance
+                # belong to one parent, so it can't be shared between orchestrators
+                specialist_instance = LazyAgentProxy.from_config(agent_conf, model_for_specialist)
 
                 pre_loaded_specialist_agents.append(specialist_instance)
-                print(f"Pre-loaded specialist agent: {agent_conf.name} (ADK name: {specialist_instance.name})")
+                print(f"Registered specialist agent: {agent_conf.name} (created on first use)")
 
             except Exception as e:
                 print(f"Failed to pre-load specialist agent {agent_conf.name}: {e}")
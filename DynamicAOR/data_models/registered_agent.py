@@ -1,5 +1,6 @@
 # cognisphere_adk/data_models/registered_agent.py
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import FrozenSet, List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 import uuid
 
@@ -15,5 +16,16 @@ class RegisteredAgent(BaseModel):
     required_tools: List[str] = Field(default_factory=list) # Names of tools this agent might need from global tools
     # Future fields: permissions, version, author, etc.
 
+    @cached_property
+    def normalized_capabilities(self) -> FrozenSet[str]:
+        """Lowercased capabilities, computed once per loaded config for routing."""
+        return frozenset(capability.lower() for capability in self.capabilities)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "capabilities":
+            # Drop the cached set so it is recomputed from the new capabilities
+            self.__dict__.pop("normalized_capabilities", None)
+
     class Config:
         validate_assignment = True # Ensure fields are validated on assignment too
\ No newline at end of file
@@ -2,7 +2,7 @@
 import os
 import json
 import uuid
-from typing import List, Optional, Dict, Any
+from typing import FrozenSet, List, Optional, Dict, Any, Tuple
 from data_models.registered_agent import RegisteredAgent
 import config  # To get the base data path
 
@@ -17,20 +17,74 @@ class AgentRegistryService:
 
         os.makedirs(self.storage_path, exist_ok=True)
         self._agents_cache: Dict[str, RegisteredAgent] = {}
-        self._load_all_agents_from_storage()
+        # Normalized capability -> cache keys of the agents offering it (a dict used as an ordered set)
+        self._capability_index: Dict[str, Dict[str, None]] = {}
+        # Cache key -> capabilities it is indexed under, so unindexing still works
+        # after the agent object itself has been changed
+        self._indexed_capabilities: Dict[str, FrozenSet[str]] = {}
+        self._storage_signature = None
+        self._refresh_cache()
 
     def _get_agent_file_path(self, agent_id: str) -> str:
         return os.path.join(self.storage_path, f"{agent_id}.json")
 
+    def _get_storage_signature(self) -> Dict[str, Tuple[int, int]]:
+        # Name -> (mtime, size) of every agent file: changes whenever one is added, removed or rewritten
+        signature = {}
+        with os.scandir(self.storage_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    signature[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    def _update_storage_signature(self, agent_id: str):
+        # Record our own write or delete of one file, so it doesn't look like an
+        # external change and trigger a full reload; other entries are left as they were
+        if self._storage_signature is None:
+            return
+        filename = f"{agent_id}.json"
+        try:
+            stat = os.stat(self._get_agent_file_path(agent_id))
+            self._storage_signature[filename] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            self._storage_signature.pop(filename, None)
+
+    def _refresh_cache(self):
+        # Only re-read and re-validate the agent files when the directory changed,
+        # so the loaded configs (and their normalized capabilities) are reused
+        signature = self._get_storage_signature()
+        if signature != self._storage_signature:
+            self._load_all_agents_from_storage()
+            self._storage_signature = signature
+
+    def _index_agent(self, key: str, agent: RegisteredAgent):
+        capabilities = agent.normalized_capabilities
+        self._indexed_capabilities[key] = capabilities
+        for capability in capabilities:
+            self._capability_index.setdefault(capability, {})[key] = None
+
+    def _unindex_agent(self, key: str):
+        for capability in self._indexed_capabilities.pop(key, ()):
+            keys = self._capability_index.get(capability)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del self._capability_index[capability]
+
     def _load_all_agents_from_storage(self):
         self._agents_cache.clear()
+        self._capability_index.clear()
+        self._indexed_capabilities.clear()
         for filename in os.listdir(self.storage_path):
             if filename.endswith(".json"):
                 agent_id = filename[:-5]  # Remove .json
                 try:
                     with open(self._get_agent_file_path(agent_id), 'r') as f:
                         data = json.load(f)
-                        self._agents_cache[agent_id] = RegisteredAgent(**data)
+                        agent = RegisteredAgent(**data)
+                        self._agents_cache[agent_id] = agent
+                        self._index_agent(agent_id, agent)
                 except (IOError, json.JSONDecodeError, TypeError) as e:
                     print(f"Error loading agent config {filename}: {e}")
 
@@ -46,7 +100,10 @@ class AgentRegistryService:
         try:
             with open(file_path, 'w') as f:
                 json.dump(agent_config.model_dump(), f, indent=2)  # Use model_dump for Pydantic
+            self._update_storage_signature(agent_config.agent_id)
+            self._unindex_agent(agent_config.agent_id)
             self._agents_cache[agent_config.agent_id] = agent_config
+            self._index_agent(agent_config.agent_id, agent_config)
             return agent_config
         except IOError as e:
             print(f"Error saving agent {agent_config.name}: {e}")
@@ -63,28 +120,40 @@ class AgentRegistryService:
                     data = json.load(f)
                     agent = RegisteredAgent(**data)
                     self._agents_cache[agent_id] = agent
+                    self._index_agent(agent_id, agent)
                     return agent
             except (IOError, json.JSONDecodeError, TypeError) as e:
                 print(f"Error loading agent config for {agent_id}: {e}")
         return None
 
     def list_agents(self) -> List[RegisteredAgent]:
-        # Ensure cache is up-to-date if files were added/removed externally
-        # For simplicity here, we rely on the cache. A more robust system
-        # might check file modification times or use a database.
-        self._load_all_agents_from_storage()  # Refresh cache
+        # Ensure cache is up-to-date if files were added/removed/changed externally
+        self._refresh_cache()
         return list(self._agents_cache.values())
 
     def find_agents_by_capability(self, capability: str) -> List[RegisteredAgent]:
-        self._load_all_agents_from_storage()  # Refresh cache
-        matched_agents = []
-        for agent in self._agents_cache.values():
-            if capability.lower() in [cap.lower() for cap in agent.capabilities]:
-                matched_agents.append(agent)
-        return matched_agents
+        self._refresh_cache()
+        return self._agents_in_order(self._capability_index.get(capability.lower(), {}))
+
+    def find_agents_matching_query(self, query: str) -> List[RegisteredAgent]:
+        """Agents with at least one capability phrase contained in the query."""
+        self._refresh_cache()
+        query_lower = query.lower()
+        # Each distinct capability is tested once, however many agents share it
+        matched: Dict[str, None] = {}
+        for capability, keys in self._capability_index.items():
+            if capability in query_lower:
+                matched.update(keys)
+        return self._agents_in_order(matched)
+
+    def _agents_in_order(self, keys: Dict[str, None]) -> List[RegisteredAgent]:
+        # Results keep the registry's agent order, whatever order the index holds them in
+        if len(keys) <= 1:
+            return [self._agents_cache[key] for key in keys]
+        return [agent for key, agent in self._agents_cache.items() if key in keys]
 
     def find_agent_by_name(self, name: str) -> Optional[RegisteredAgent]:
-        self._load_all_agents_from_storage()  # Refresh cache
+        self._refresh_cache()
         for agent in self._agents_cache.values():
             if agent.name.lower() == name.lower():
                 return agent
@@ -93,11 +162,13 @@ class AgentRegistryService:
     def delete_agent(self, agent_id: str) -> bool:
         if agent_id in self._agents_cache:
             del self._agents_cache[agent_id]
+            self._unindex_agent(agent_id)
 
         file_path = self._get_agent_file_path(agent_id)
         if os.path.exists(file_path):
             try:
                 os.remove(file_path)
+                self._update_storage_signature(agent_id)
                 return True
             except OSError as e:
                 print(f"Error deleting agent file {agent_id}: {e}")
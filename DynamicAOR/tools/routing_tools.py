@@ -37,15 +37,6 @@ async def classify_and_route_query_tool(
     # For this example, let's define the prompt and assume the orchestrator's LLM will use it.
     # A more advanced system might have a dedicated intent classification model/service.
 
-    registered_agents = agent_registry.list_agents()
-    agent_capabilities_summary = []
-    for agent in registered_agents:
-        capabilities_str = ", ".join(agent.capabilities)
-        agent_capabilities_summary.append(
-            f"- {agent.name} (ID: {agent.agent_id}): Specializes in {agent.description}. Handles: {capabilities_str}")
-
-    capabilities_list_str = "\n".join(agent_capabilities_summary)
-
     # This prompt will be used by the OrchestratorAgent's LLM when it calls this tool.
     # The tool itself doesn't make an LLM call to classify, it *provides the info* for the Orchestrator to classify.
     # The actual classification decision comes from the Orchestrator's LLM *after* this tool runs.
@@ -53,15 +44,9 @@ async def classify_and_route_query_tool(
     # This tool's job is to find agents based on keywords in the query matching agent capabilities.
     # The Orchestrator LLM then uses this tool's output + its own reasoning to pick the best agent.
 
-    found_agents = []
-    query_lower = user_query.lower()
-
-    for agent_config in registered_agents:
-        for capability in agent_config.capabilities:
-            if capability.lower() in query_lower:
-                if agent_config not in found_agents:  # Avoid duplicates
-                    found_agents.append(agent_config)
-                # Could add more sophisticated matching here (e.g., TF-IDF, embeddings)
+    # The registry's capability index tests each distinct capability once instead of
+    # walking every agent. Could add more sophisticated matching here (e.g., TF-IDF, embeddings)
+    found_agents = agent_registry.find_agents_matching_query(user_query)
 
     if not found_agents:
         return {
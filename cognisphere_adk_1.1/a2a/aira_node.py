@@ -1,12 +1,23 @@
 import aiohttp
 import asyncio
+import heapq
+import itertools
+import random
 import time
-import hashlib
-import json
+import hmac
 import logging
-from typing import List, Dict, Optional, Any
+import orjson
+from typing import List, Dict, Optional, Any, Tuple
 from pydantic import BaseModel, Field, validator
-from urllib.parse import urljoin
+from urllib.parse import urljoin, quote
+
+# MessagePack is optional; without it the node only speaks JSON to the hub
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
 
 # Configure logging
 logging.basicConfig(
@@ -16,6 +27,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Advertise MessagePack to hubs that support it; others keep answering with JSON
+_HUB_HEADERS = {"Accept": f"{MSGPACK_CONTENT_TYPE}, application/json;q=0.9"} if HAS_MSGPACK else {}
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson (used as aiohttp's json_serialize)."""
+    return orjson.dumps(obj).decode()
+
+
+async def _read_hub_body(resp: aiohttp.ClientResponse) -> Any:
+    """Decode a hub response body, honouring a negotiated MessagePack reply."""
+    body = await resp.read()
+    if HAS_MSGPACK and resp.content_type == MSGPACK_CONTENT_TYPE:
+        return msgpack.unpackb(body, raw=False)
+    return orjson.loads(body)
+
+
 class Resource(BaseModel):
     """Represents a shared resource in the AIRA network."""
     uri: str
@@ -32,6 +62,161 @@ class Resource(BaseModel):
         return v
 
 
+class HeartbeatScheduler:
+    """
+    Drives the heartbeats of every AiraNode on one event loop from a single task.
+
+    Nodes are kept in a heap ordered by their next due time. Nodes that fall due
+    together and share a hub are sent as one POST to the hub's /heartbeat-batch
+    endpoint. A hub that doesn't have that endpoint is remembered and gets
+    per-node heartbeats from then on.
+    """
+
+    # Nodes due within this many seconds of each other are sent together
+    COALESCE_WINDOW = 1.0
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, "AiraNode"]] = []
+        self._seq = itertools.count()
+        # Node -> sequence number of its live heap entry; older entries are skipped
+        self._entries: Dict["AiraNode", int] = {}
+        self._batch_unsupported: set = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def add(self, node: "AiraNode"):
+        """Schedule a node, sending its first heartbeat right away."""
+        loop = asyncio.get_running_loop()
+        self._push(node, loop.time())
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        else:
+            self._wakeup.set()
+
+    def remove(self, node: "AiraNode"):
+        """Stop sending heartbeats for a node."""
+        if self._entries.pop(node, None) is not None and self._wakeup:
+            self._wakeup.set()
+
+    def _push(self, node: "AiraNode", due: float):
+        seq = next(self._seq)
+        self._entries[node] = seq
+        heapq.heappush(self._heap, (due, seq, node))
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+
+        while self._entries:
+            # Discard entries left behind by removed or rescheduled nodes
+            while self._heap and self._entries.get(self._heap[0][2]) != self._heap[0][1]:
+                heapq.heappop(self._heap)
+
+            now = loop.time()
+            delay = self._heap[0][0] - now
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            due_by_hub: Dict[str, List["AiraNode"]] = {}
+            while self._heap and self._heap[0][0] <= now + self.COALESCE_WINDOW:
+                _, seq, node = heapq.heappop(self._heap)
+                if self._entries.get(node) == seq:
+                    due_by_hub.setdefault(node.hub_url, []).append(node)
+
+            await asyncio.gather(*(
+                self._beat(hub_url, nodes) for hub_url, nodes in due_by_hub.items()
+            ))
+
+            now = loop.time()
+            for nodes in due_by_hub.values():
+                for node in nodes:
+                    if node in self._entries:
+                        self._push(node, now + node._next_heartbeat_delay())
+
+    async def _beat(self, hub_url: str, nodes: List["AiraNode"]):
+        """Send heartbeats for nodes sharing a hub, batching registered ones when possible."""
+        pending = nodes
+        registered = [n for n in nodes if n.registration_status.get("registered", False)]
+
+        if len(registered) > 1 and hub_url not in self._batch_unsupported:
+            node = registered[0]
+            try:
+                await node._ensure_session()
+                async with node.session.post(
+                        f"{hub_url}/heartbeat-batch",
+                        json={"nodes": [n.agent_url for n in registered]},
+                        timeout=aiohttp.ClientTimeout(total=node.registration_timeout)
+                ) as resp:
+                    if resp.status == 200:
+                        rejected = await self._rejected_nodes(resp)
+                        if rejected is None:
+                            logger.warning("Unreadable batch heartbeat reply from %s; sending per-node heartbeats", hub_url)
+                        else:
+                            # Nodes the hub no longer knows go through _send_heartbeat, which re-registers them
+                            for n in registered:
+                                if n.agent_url in rejected:
+                                    logger.info("Hub %s no longer knows %s; re-registering", hub_url, n.agent_url)
+                                    n.registration_status["registered"] = False
+                            pending = [n for n in nodes if n not in registered or n.agent_url in rejected]
+                            for n in registered:
+                                if n not in pending:
+                                    n._heartbeat_failed = False
+                    elif resp.status in (404, 405):
+                        self._batch_unsupported.add(hub_url)
+                    else:
+                        logger.warning("Batch heartbeat failed: %s", resp.status)
+            except Exception as e:
+                logger.error("Batch heartbeat error: %s", e)
+
+        results = await asyncio.gather(*(n._send_heartbeat() for n in pending), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Heartbeat error: %s", result)
+
+    @staticmethod
+    async def _rejected_nodes(resp: aiohttp.ClientResponse) -> Optional[set]:
+        """
+        Agent URLs a /heartbeat-batch reply did not accept, or None if the reply can't be read.
+
+        The hub lists them under "unknown" or "expired", or reports a per-node
+        status other than "ok" in a "results" mapping of agent URL to status.
+        """
+        try:
+            body = await _read_hub_body(resp)
+        except Exception:
+            return None
+        if not isinstance(body, dict):
+            return None
+
+        rejected = set(body.get("unknown") or ()) | set(body.get("expired") or ())
+        results = body.get("results")
+        if isinstance(results, dict):
+            rejected.update(url for url, status in results.items() if status != "ok")
+        return rejected
+
+
+# One scheduler per event loop: its task and the nodes' sessions belong to that loop
+_heartbeat_schedulers: Dict[asyncio.AbstractEventLoop, HeartbeatScheduler] = {}
+
+
+def _get_heartbeat_scheduler() -> HeartbeatScheduler:
+    """Return the heartbeat scheduler of the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    scheduler = _heartbeat_schedulers.get(loop)
+    if scheduler is None:
+        # Schedulers of loops that have been closed can't run again
+        for closed in [l for l in _heartbeat_schedulers if l.is_closed()]:
+            del _heartbeat_schedulers[closed]
+        scheduler = _heartbeat_schedulers[loop] = HeartbeatScheduler()
+    return scheduler
+
+
 class AiraNode:
     """
     Advanced AIRA Node for agent registration, discovery, and interaction.
@@ -44,6 +229,9 @@ class AiraNode:
     - Tool invocation
     """
 
+    # Longest wait, in seconds, between heartbeat attempts while the hub keeps failing
+    HEARTBEAT_BACKOFF_CAP = 300.0
+
     def __init__(
             self,
             hub_url: str,
@@ -69,6 +257,14 @@ class AiraNode:
         self.agent_name = agent_name
         self.private_key = private_key
 
+        # Keyed HMAC state; each signature copies it instead of re-deriving the key pads
+        self._hmac_template = hmac.new(private_key.encode(), digestmod='sha256') if private_key else None
+
+        # Hub endpoints never change for a node, so build them once
+        self._register_url = f"{self.hub_url}/register"
+        self._discover_url = f"{self.hub_url}/discover"
+        self._heartbeat_url = f"{self.hub_url}/heartbeat/{quote(self.agent_url, safe='')}"
+
         # Configuration
         self.registration_timeout = registration_timeout
         self.heartbeat_interval = heartbeat_interval
@@ -76,22 +272,34 @@ class AiraNode:
         # State management
         self.session: Optional[aiohttp.ClientSession] = None
         self.shared_resources: List[Resource] = []
+        # Signed registration payload, rebuilt only when shared resources change
+        self._registration_payload: Optional[Dict[str, Any]] = None
         self.registration_status: Dict[str, Any] = {
             "registered": False,
             "last_registration_time": None,
             "registration_attempts": 0
         }
 
-        # Heartbeat task management
-        self._heartbeat_task: Optional[asyncio.Task] = None
+        # Heartbeat retry state: the last failed attempt backs off the next one
+        self._heartbeat_failed = False
+        self._heartbeat_backoff = 1.0
+        self._heartbeat_scheduler: Optional[HeartbeatScheduler] = None
 
         # Logging setup
         self.logger = logger
 
     async def _ensure_session(self):
-        """Ensure an aiohttp ClientSession is available."""
+        """Ensure a pooled aiohttp ClientSession is available."""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            # One keep-alive pool for every hub call instead of aiohttp's 100-connection default
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=64,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(connector=connector, json_serialize=_json_dumps)
 
     def _generate_signature(self, data: dict) -> str:
         """
@@ -103,18 +311,53 @@ class AiraNode:
         Returns:
             Hexadecimal signature string
         """
-        if not self.private_key:
+        if not self._hmac_template:
             return ""
 
         try:
-            return hashlib.sha256(
-                json.dumps(data, sort_keys=True).encode() +
-                self.private_key.encode()
-            ).hexdigest()
+            h = self._hmac_template.copy()
+            h.update(orjson.dumps(data, option=orjson.OPT_SORT_KEYS))
+            return h.hexdigest()
         except Exception as e:
             self.logger.error(f"Signature generation failed: {e}")
             return ""
 
+    def share_resource(self, resource: Resource):
+        """
+        Add a resource to share with the hub on the next registration.
+
+        Args:
+            resource: Resource to share
+        """
+        self.shared_resources.append(resource)
+        self._registration_payload = None
+
+    def _get_registration_payload(self) -> Dict[str, Any]:
+        """
+        Return the signed registration payload.
+
+        The payload and its signature are canonicalized once and reused until
+        share_resource() invalidates them.
+        """
+        if self._registration_payload is None:
+            payload = {
+                "url": self.agent_url,
+                "name": self.agent_name,
+                "skills": [],  # Populate skills dynamically
+                "shared_resources": [r.dict() for r in self.shared_resources],
+                "aira_capabilities": ["a2a", "resource_sharing"],
+                "auth": {},  # Configure authentication if needed
+                "signature": "",  # Add signature if private key is available
+                "tags": ["cognitive", "ai", "agent"]
+            }
+
+            # Add signature if private key exists
+            if self.private_key:
+                payload["signature"] = self._generate_signature(payload)
+
+            self._registration_payload = payload
+        return self._registration_payload
+
     async def register(self) -> Dict[str, Any]:
         """
         Register the agent with the AIRA hub.
@@ -126,34 +369,21 @@ class AiraNode:
         """
         await self._ensure_session()
 
-        # Prepare registration payload
-        payload = {
-            "url": self.agent_url,
-            "name": self.agent_name,
-            "skills": [],  # Populate skills dynamically
-            "shared_resources": [r.dict() for r in self.shared_resources],
-            "aira_capabilities": ["a2a", "resource_sharing"],
-            "auth": {},  # Configure authentication if needed
-            "signature": "",  # Add signature if private key is available
-            "tags": ["cognitive", "ai", "agent"]
-        }
-
-        # Add signature if private key exists
-        if self.private_key:
-            payload["signature"] = self._generate_signature(payload)
+        payload = self._get_registration_payload()
 
         try:
             # Use explicit timeout
             timeout = aiohttp.ClientTimeout(total=self.registration_timeout)
 
             async with self.session.post(
-                    f"{self.hub_url}/register",
+                    self._register_url,
                     json=payload,
+                    headers=_HUB_HEADERS,
                     timeout=timeout
             ) as resp:
                 # Detailed logging and error handling
                 if resp.status in (200, 201):
-                    response_data = await resp.json()
+                    response_data = await _read_hub_body(resp)
                     self.registration_status.update({
                         "registered": True,
                         "last_registration_time": time.time(),
@@ -174,49 +404,52 @@ class AiraNode:
 
     async def start_heartbeat(self):
         """
-        Start periodic heartbeat task.
-        Ensures only one heartbeat task is running.
+        Start periodic heartbeats.
+        Every node on the running event loop shares one scheduler task, so
+        calling this again only reschedules this node.
         """
-        # Cancel existing heartbeat task if running
-        if self._heartbeat_task and not self._heartbeat_task.done():
-            self._heartbeat_task.cancel()
-
-        async def heartbeat_loop():
-            while True:
-                try:
-                    await self._send_heartbeat()
-                    await asyncio.sleep(self.heartbeat_interval)
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    self.logger.error(f"Heartbeat error: {e}")
-                    await asyncio.sleep(self.heartbeat_interval)
-
-        self._heartbeat_task = asyncio.create_task(heartbeat_loop())
+        if self._heartbeat_scheduler is not None:
+            self._heartbeat_scheduler.remove(self)
+        self._heartbeat_scheduler = _get_heartbeat_scheduler()
+        self._heartbeat_scheduler.add(self)
 
     async def _send_heartbeat(self):
         """
         Send a heartbeat to the AIRA hub.
-        Handles connection and registration status.
+        Handles connection and registration status. A failed heartbeat marks the
+        node unregistered, and the re-registration waits for the next (backed-off)
+        attempt instead of hitting the hub straight away.
         """
         await self._ensure_session()
 
-        if not self.registration_status.get("registered", False):
-            await self.register()
-
         try:
+            if not self.registration_status.get("registered", False):
+                await self.register()
+
             async with self.session.post(
-                    f"{self.hub_url}/heartbeat/{self.agent_name}"
+                    self._heartbeat_url
             ) as resp:
                 if resp.status != 200:
                     self.logger.warning(f"Heartbeat failed: {resp.status}")
-                    # Optional: Attempt re-registration
-                    await self.register()
+                    self.registration_status["registered"] = False
+                    self._heartbeat_failed = True
+                else:
+                    self._heartbeat_failed = False
         except Exception as e:
             self.logger.error(f"Heartbeat error: {e}")
-            # Attempt to re-register or reset session
+            self._heartbeat_failed = True
+            # Reset the session if it was closed
             await self._ensure_session()
 
+    def _next_heartbeat_delay(self) -> float:
+        """Seconds until the next heartbeat: the interval, or a jittered backoff after a failure."""
+        if not self._heartbeat_failed:
+            self._heartbeat_backoff = 1.0
+            return self.heartbeat_interval
+        # Decorrelated jitter, so nodes don't all retry together when the hub comes back
+        self._heartbeat_backoff = min(self.HEARTBEAT_BACKOFF_CAP, self._heartbeat_backoff * random.uniform(1.0, 3.0))
+        return self._heartbeat_backoff
+
     async def discover_agents(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict]:
         """
         Discover agents with comprehensive filtering options.
@@ -232,11 +465,12 @@ class AiraNode:
         try:
             params = filters or {}
             async with self.session.post(
-                    f"{self.hub_url}/discover",
-                    json=params
+                    self._discover_url,
+                    json=params,
+                    headers=_HUB_HEADERS
             ) as resp:
                 if resp.status == 200:
-                    agents = await resp.json()
+                    agents = await _read_hub_body(resp)
                     self.logger.info(f"Discovered {len(agents)} agents")
                     return agents
                 else:
@@ -251,13 +485,10 @@ class AiraNode:
         """
         Gracefully close all resources.
         """
-        # Cancel heartbeat task
-        if self._heartbeat_task and not self._heartbeat_task.done():
-            self._heartbeat_task.cancel()
-            try:
-                await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
+        # Stop heartbeats for this node
+        if self._heartbeat_scheduler is not None:
+            self._heartbeat_scheduler.remove(self)
+            self._heartbeat_scheduler = None
 
         # Close aiohttp session
         if self.session and not self.session.closed:
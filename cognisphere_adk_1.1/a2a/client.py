@@ -3,24 +3,34 @@
 
 import aiohttp
 import uuid
-import json
+import time
+import orjson
 import asyncio
-from typing import Dict, Any, List, Optional, AsyncGenerator
+from typing import Dict, Any, List, Optional, AsyncGenerator, Tuple
 
 
 class A2AClient:
     """Cliente para interagir com agentes que implementam o protocolo A2A."""
 
-    def __init__(self, default_timeout: int = 60):
+    def __init__(self, default_timeout: int = 60, cache_ttl: int = 300):
         """
         Inicializa o cliente A2A.
 
         Args:
             default_timeout: Tempo limite padrão para requisições em segundos
+            cache_ttl: Tempo em segundos que um Agent Card permanece em cache
         """
         self.default_timeout = default_timeout
         self.session = None
 
+        # Cache de Agent Cards: URL do agente -> (instante monotônico, card)
+        self.cache_ttl = cache_ttl
+        self.discovery_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Buscas em andamento por URL: chamadas simultâneas aguardam a mesma requisição
+        self._discovery_inflight: Dict[str, asyncio.Future] = {}
+        # Cabeçalhos condicionais (If-None-Match / If-Modified-Since) por URL do agente
+        self._card_validators: Dict[str, Dict[str, str]] = {}
+
     async def __aenter__(self):
         """Inicializa a sessão HTTP ao entrar no contexto."""
         self.session = aiohttp.ClientSession()
@@ -53,18 +63,68 @@ class A2AClient:
         if agent_url.endswith('/'):
             agent_url = agent_url[:-1]
 
+        cached = self._get_cached_card(agent_url)
+        if cached is not None:
+            return cached
+
+        # Uma busca de outro event loop não pode ser aguardada aqui; inicia uma nova
+        inflight = self._discovery_inflight.get(agent_url)
+        if inflight is None or inflight.get_loop() is not asyncio.get_running_loop():
+            inflight = asyncio.ensure_future(self._fetch_agent_card(agent_url))
+            self._discovery_inflight[agent_url] = inflight
+            # Remove a entrada ao concluir, com sucesso ou erro, para o dicionário não crescer
+            inflight.add_done_callback(lambda done: self._forget_inflight(agent_url, done))
+        # shield: cancelar um chamador não cancela a busca compartilhada com os demais
+        return await asyncio.shield(inflight)
+
+    def _forget_inflight(self, agent_url: str, done: asyncio.Future):
+        """Remove a busca concluída, sem apagar uma mais nova para a mesma URL."""
+        if self._discovery_inflight.get(agent_url) is done:
+            del self._discovery_inflight[agent_url]
+
+    async def _fetch_agent_card(self, agent_url: str) -> Dict[str, Any]:
+        """Busca o Agent Card na rede e atualiza o cache."""
         card_url = f"{agent_url}/.well-known/agent.json"
 
+        # Com um card expirado em mãos, faz um GET condicional: um 304 dispensa o corpo
+        entry = self.discovery_cache.get(agent_url)
+        headers = self._card_validators.get(agent_url) if entry else None
+
         try:
-            async with self.session.get(card_url, timeout=self.default_timeout) as response:
-                if response.status == 200:
-                    return await response.json()
+            async with self.session.get(card_url, headers=headers, timeout=self.default_timeout) as response:
+                if response.status == 304 and entry:
+                    agent_card = entry[1]
+                elif response.status == 200:
+                    agent_card = await response.json()
+                    self._card_validators[agent_url] = self._extract_validators(response)
                 else:
                     error_text = await response.text()
                     raise ValueError(f"Failed to get agent card: {response.status} - {error_text}")
         except Exception as e:
             raise ConnectionError(f"Error connecting to agent at {card_url}: {str(e)}")
 
+        self.discovery_cache[agent_url] = (time.monotonic(), agent_card)
+        return agent_card
+
+    @staticmethod
+    def _extract_validators(response: aiohttp.ClientResponse) -> Dict[str, str]:
+        """Monta os cabeçalhos condicionais a partir do ETag/Last-Modified da resposta."""
+        validators = {}
+        etag = response.headers.get('ETag')
+        if etag:
+            validators['If-None-Match'] = etag
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            validators['If-Modified-Since'] = last_modified
+        return validators
+
+    def _get_cached_card(self, agent_url: str) -> Optional[Dict[str, Any]]:
+        """Retorna o Agent Card em cache se ainda estiver dentro do TTL."""
+        entry = self.discovery_cache.get(agent_url)
+        if entry and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[1]
+        return None
+
     async def tasks_send(
             self,
             agent_url: str,
@@ -255,41 +315,29 @@ class A2AClient:
                     error_text = await response.text()
                     raise ValueError(f"Failed to start streaming task: {response.status} - {error_text}")
 
-                # Processar o stream de eventos SSE
-                buffer = ""
-                async for line in response.content:
-                    line = line.decode('utf-8')
-                    buffer += line
-
-                    # Se temos pelo menos uma linha completa
-                    if '\n\n' in buffer:
-                        parts = buffer.split('\n\n')
-                        events = parts[:-1]  # Todos os eventos completos
-                        buffer = parts[-1]  # Resto incompleto
-
-                        for event_data in events:
-                            if not event_data.strip():
-                                continue
-
-                            # Extrair tipo de evento e dados
-                            event_type = None
-                            data = None
-
-                            for line in event_data.split('\n'):
-                                if line.startswith('event:'):
-                                    event_type = line[6:].strip()
-                                elif line.startswith('data:'):
-                                    data = line[5:].strip()
-
-                            if data:
-                                try:
-                                    parsed_data = json.loads(data)
-                                    yield {
-                                        "event_type": event_type,
-                                        "data": parsed_data
-                                    }
-                                except json.JSONDecodeError:
-                                    # Dados inválidos, ignorar
-                                    pass
+                # Processar o stream de eventos SSE linha a linha, sem acumular o corpo;
+                # cada evento é emitido assim que chega a linha em branco que o encerra
+                event_type = None
+                data = None
+                async for raw_line in response.content:
+                    line = raw_line.rstrip(b'\r\n')
+
+                    if line.startswith(b'event:'):
+                        event_type = line[6:].strip().decode('utf-8')
+                    elif line.startswith(b'data:'):
+                        data = line[5:].strip()
+                    elif not line:
+                        if data:
+                            try:
+                                yield {
+                                    "event_type": event_type,
+                                    "data": orjson.loads(data)
+                                }
+                            except orjson.JSONDecodeError:
+                                # Dados inválidos, ignorar
+                                pass
+
+                        event_type = None
+                        data = None
         except Exception as e:
             raise ConnectionError(f"Error in streaming connection to {tasks_url}: {str(e)}")
\ No newline at end of file
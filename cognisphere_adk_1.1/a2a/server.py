@@ -3,41 +3,48 @@
 
 import json
 import uuid
+import orjson
 from flask import Blueprint, request, jsonify, Response, stream_with_context
 
 
 # Definir o Agent Card diretamente aqui (sem importar)
-def get_agent_card():
-    """Retorna o Agent Card do Cognisphere."""
-    return {
-        "name": "Cognisphere",
-        "description": "Advanced cognitive architecture with sophisticated memory and narrative capabilities",
-        "version": "1.0.0",
-        "endpoint": "/a2a",  # Endpoint relativo à base URL
-        "capabilities": ["streaming"],
-        "skills": [
-            {
-                "id": "memory-management",
-                "name": "Memory Management",
-                "description": "Store, retrieve, and analyze memories of different types and emotional significance"
-            },
-            {
-                "id": "narrative-weaving",
-                "name": "Narrative Weaving",
-                "description": "Create and manage narrative threads that organize experiences into meaningful stories"
-            },
-            {
-                "id": "emotion-analysis",
-                "name": "Emotion Analysis",
-                "description": "Analyze emotional content and context of interactions"
-            }
-        ],
-        "auth": {
-            "type": "apiKey",
-            "in": "header",
-            "name": "X-API-Key"
+# Construído e serializado uma única vez, pois o conteúdo nunca muda
+_AGENT_CARD = {
+    "name": "Cognisphere",
+    "description": "Advanced cognitive architecture with sophisticated memory and narrative capabilities",
+    "version": "1.0.0",
+    "endpoint": "/a2a",  # Endpoint relativo à base URL
+    "capabilities": ["streaming"],
+    "skills": [
+        {
+            "id": "memory-management",
+            "name": "Memory Management",
+            "description": "Store, retrieve, and analyze memories of different types and emotional significance"
+        },
+        {
+            "id": "narrative-weaving",
+            "name": "Narrative Weaving",
+            "description": "Create and manage narrative threads that organize experiences into meaningful stories"
+        },
+        {
+            "id": "emotion-analysis",
+            "name": "Emotion Analysis",
+            "description": "Analyze emotional content and context of interactions"
         }
+    ],
+    "auth": {
+        "type": "apiKey",
+        "in": "header",
+        "name": "X-API-Key"
     }
+}
+
+_AGENT_CARD_BYTES = orjson.dumps(_AGENT_CARD)
+
+
+def get_agent_card():
+    """Retorna o Agent Card do Cognisphere (instância compartilhada, não modificar)."""
+    return _AGENT_CARD
 
 
 # Criar Blueprint para as rotas A2A
@@ -50,7 +57,7 @@ tasks = {}
 @a2a_bp.route('/.well-known/agent.json')
 def agent_json():
     """Endpoint para obter o Agent Card."""
-    return jsonify(get_agent_card())
+    return Response(_AGENT_CARD_BYTES, mimetype='application/json')
 
 
 @a2a_bp.route('/tasks/send', methods=['POST'])
@@ -60,7 +67,8 @@ def tasks_send():
     from app import runner
 
     data = request.json
-    task_id = data.get('taskId', str(uuid.uuid4()))
+    # Gera um UUID apenas quando o cliente não enviou um taskId
+    task_id = data.get('taskId') or str(uuid.uuid4())
     user_id = f"a2a_user_{task_id[:8]}"
 
     # Obter a mensagem do usuário
@@ -18,7 +18,7 @@ from .tools import (
     register_memory_tools_with_aira,
     register_narrative_tools_with_aira,
     register_emotion_tools_with_aira,
-    aira_tools
+    get_aira_tools
 )
 
 __all__ = [
@@ -28,5 +28,13 @@ __all__ = [
     'register_memory_tools_with_aira',
     'register_narrative_tools_with_aira',
     'register_emotion_tools_with_aira',
+    'get_aira_tools',
     'aira_tools'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # aira_tools is built lazily by aira.tools.get_aira_tools()
+    if name == "aira_tools":
+        return get_aira_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -7,19 +7,44 @@ of tools from other agents using A2A and MCP protocols.
 """
 
 import os
-import json
+import re
+import time
+import random
+import itertools
+import hashlib
+import importlib.util
 import asyncio
 import aiohttp
+import orjson
 import logging
 from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
-import traceback
 import urllib.parse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# aiodns is optional; with it the connector resolves hub and agent hosts asynchronously.
+# Only its presence matters (aiohttp imports it), so it isn't imported here
+HAS_AIODNS = importlib.util.find_spec("aiodns") is not None
+
+# Logging is configured by the application
 logger = logging.getLogger("cognisphere_aira")
 
+# Fallback "query: ..." extraction for memory tools when the message has no JSON
+_QUERY_RE = re.compile(r'query[:\s]+([^\n]+)', re.IGNORECASE)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson (used as aiohttp's json_serialize)."""
+    return orjson.dumps(obj).decode()
+
+
+def _first_text_part(parts: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return the first text part of an A2A message, checking the common first-part case directly."""
+    if parts and parts[0].get("type") == "text":
+        return parts[0]
+    for part in parts:
+        if part.get("type") == "text":
+            return part
+    return None
+
 
 class CognisphereAiraClient:
     """
@@ -32,12 +57,21 @@ class CognisphereAiraClient:
     4. Expose Cognisphere tools to other agents
     """
 
+    # Seconds between heartbeats while the hub is healthy
+    HEARTBEAT_INTERVAL = 30
+
     def __init__(
             self,
             hub_url: str,
             agent_url: str,
             agent_name: str = "Cognisphere",
-            agent_description: str = "Advanced cognitive architecture with sophisticated memory and narrative capabilities"
+            agent_description: str = "Advanced cognitive architecture with sophisticated memory and narrative capabilities",
+            pool_limit: int = 0,
+            pool_limit_per_host: int = 32,
+            keepalive_timeout: float = 60,
+            card_fresh_ttl: float = 60,
+            card_stale_ttl: float = 300,
+            agents_ttl: float = 20
     ):
         """
         Initialize the AIRA client for Cognisphere.
@@ -47,48 +81,123 @@ class CognisphereAiraClient:
             agent_url: URL where this agent is accessible
             agent_name: Name of this agent
             agent_description: Description of this agent
+            pool_limit: Maximum open connections in total (0 for no limit)
+            pool_limit_per_host: Maximum open connections to a single hub or agent
+            keepalive_timeout: Seconds an idle keep-alive connection is kept open
+            card_fresh_ttl: Seconds a cached agent card is served without refreshing
+            card_stale_ttl: Seconds a cached agent card may be served while it refreshes
+            agents_ttl: Seconds the hub's agent list is reused before asking again
         """
         self.hub_url = hub_url.rstrip('/')
         self.agent_url = agent_url
         self.agent_name = agent_name
         self.agent_description = agent_description
 
-        # Session management
-        self.session = None
+        # URL encode properly to avoid 404 errors on the heartbeat endpoint
+        self._encoded_agent_url = urllib.parse.quote(agent_url, safe='')
+        self._set_hub_urls()
+
+        # Session management: one ClientSession per event loop that uses the client.
+        # The web routes drive it from their own loop while ADK tools await it on the
+        # app's loop, and a session can't be shared across (or closed from) another loop
+        self._sessions = {}
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
 
         # Registration status
         self.registered = False
         self._heartbeat_task = None
+        # Last heartbeat retry delay in seconds; grows with random jitter up to 60
+        self._hb_backoff = 1.0
+        # Loop time of the last successful heartbeat or registration
+        self._last_heartbeat = 0.0
 
         # Discovery tracking
         self.discovered_agents = {}
         self.discovered_tools = {}
         self.local_tools = []
+        # (lowercased name, tool, implementation, implementation is async) kept in
+        # registration order for request matching
+        self._tool_lower_index = []
+        # A2A skill entries, built once per tool when it is added
+        self._tool_skills = []
+        # Agent card served to hubs and peers; cleared whenever a tool is added
+        self._agent_card_cache = None
+        # Hub registration payload built from the card; cleared with it
+        self._registration_payload = None
+
+        # Agent card cache: normalized URL -> (monotonic time, card)
+        self._card_cache = {}
+        # Background card refreshes in flight, by normalized URL
+        self._card_refreshes = {}
+        self.card_fresh_ttl = card_fresh_ttl
+        self.card_stale_ttl = card_stale_ttl
+
+        # Hub agent list cache: (monotonic time, agents); cleared when the hub changes
+        self._agents_cache = None
+        self.agents_ttl = agents_ttl
+
+        # Outgoing task ids; seeded from the wall clock so ids stay unique across restarts
+        self._task_seq = itertools.count(time.time_ns())
+
+        # Shared futures for coalesced invoke_agent_tool calls, keyed by request digest
+        self._inflight = {}
+
+        # A2A JSON-RPC method -> handler
+        self._a2a_handlers = {
+            "tasks/send": self._handle_tasks_send,
+            "tasks/get": self._handle_tasks_get
+        }
+
+    def _set_hub_urls(self):
+        """Build the hub endpoint URLs; they only change when the hub does."""
+        self._register_url = f"{self.hub_url}/register"
+        self._heartbeat_url = f"{self.hub_url}/heartbeat/{self._encoded_agent_url}"
+        self._agents_url = f"{self.hub_url}/agents"
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """The ClientSession of the running event loop, or None if it has none yet."""
+        try:
+            return self._sessions.get(asyncio.get_running_loop())
+        except RuntimeError:
+            return None
 
     async def ensure_session(self):
         """
-        Make sure we have a ClientSession bound to the *current* loop.
-        If an existing session belongs to another loop, close it and
-        create a fresh one on this loop.
+        Make sure the *current* loop has an open ClientSession.
+        Sessions owned by other loops are left alone; only entries for
+        loops that have since been closed are dropped.
         """
         current_loop = asyncio.get_running_loop()
-
-        if (
-                self.session is None
-                or self.session.closed
-                or getattr(self.session, "_loop", None) is not current_loop
-        ):
-            if self.session and not self.session.closed:
-                await self.session.close()
-
-            from aiohttp import ClientTimeout
-            self.session = aiohttp.ClientSession(timeout=ClientTimeout(total=30))
+        session = self._sessions.get(current_loop)
+
+        if session is None or session.closed:
+            for loop in [loop for loop in self._sessions if loop.is_closed()]:
+                del self._sessions[loop]
+
+            # Keep-alive pool shared by hub heartbeats, discovery and A2A calls,
+            # instead of aiohttp's default 100-connection cap
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                resolver=aiohttp.AsyncResolver() if HAS_AIODNS else None
+            )
+            self._sessions[current_loop] = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30, connect=5),
+                json_serialize=_json_dumps
+            )
 
     async def start(self):
         """Start the AIRA client and register with the hub."""
         await self.ensure_session()
         await self.register_with_hub()
-        logger.info(f"Cognisphere registered with AIRA hub at {self.hub_url}")
+        logger.info("Cognisphere registered with AIRA hub at %s", self.hub_url)
 
     async def stop(self):
         """Stop the AIRA client and clean up resources."""
@@ -98,20 +207,30 @@ class CognisphereAiraClient:
                 await self._heartbeat_task
             except asyncio.CancelledError:
                 pass
+            self._heartbeat_task = None
 
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
-
-        logger.info(f"Cognisphere disconnected from AIRA hub")
-
-    async def register_with_hub(self):
-        """Register this agent with the AIRA hub."""
+        current_loop = asyncio.get_running_loop()
+        sessions, self._sessions = self._sessions, {}
+        for loop, session in sessions.items():
+            if session.closed:
+                continue
+            if loop is current_loop:
+                await session.close()
+            elif loop.is_running():
+                # Closed on the loop that owns it, without waiting here
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+        if sessions:
+            # Give the connector a moment to close keep-alive (and TLS) transports
+            await asyncio.sleep(0.25)
+
+        logger.info("Cognisphere disconnected from AIRA hub")
+
+    def _build_registration_payload(self):
+        """Build the hub registration payload from the agent card."""
         # Generate agent capabilities from local tools
         agent_card = self._generate_agent_card()
 
-        # Create registration payload
-        payload = {
+        return {
             "url": self.agent_url,
             "name": self.agent_name,
             "description": self.agent_description,
@@ -122,6 +241,13 @@ class CognisphereAiraClient:
             "tags": ["cognisphere", "memory", "narrative"]
         }
 
+    async def register_with_hub(self):
+        """Register this agent with the AIRA hub."""
+        # The payload only changes when a tool is added
+        if self._registration_payload is None:
+            self._registration_payload = self._build_registration_payload()
+        payload = self._registration_payload
+
         try:
             # Ensure session exists
             await self.ensure_session()
@@ -131,19 +257,20 @@ class CognisphereAiraClient:
             timeout = ClientTimeout(total=30)
 
             # Send registration request
-            async with self.session.post(f"{self.hub_url}/register", json=payload, timeout=timeout) as resp:
+            async with self.session.post(self._register_url, json=payload, timeout=timeout) as resp:
                 if resp.status == 201:  # Success status for registration
                     result = await resp.json()
-                    logger.info(f"Successfully registered with hub: {result}")
+                    logger.info("Successfully registered with hub: %s", result)
                     self.registered = True
+                    self._last_heartbeat = asyncio.get_running_loop().time()
                     self._start_heartbeat()
                     return result
                 else:
                     error_text = await resp.text()
-                    logger.error(f"Registration failed with status {resp.status}: {error_text}")
+                    logger.error("Registration failed with status %s: %s", resp.status, error_text)
                     raise ValueError(f"Registration failed with status {resp.status}: {error_text}")
         except Exception as e:
-            logger.error(f"Error registering with hub {self.hub_url}: {str(e)}")
+            logger.error("Error registering with hub %s: %s", self.hub_url, e)
             raise ValueError(f"Failed to register with hub: {str(e)}")
 
     def _start_heartbeat(self):
@@ -153,51 +280,66 @@ class CognisphereAiraClient:
 
     async def _heartbeat_loop(self):
         """Send periodic heartbeats to the hub."""
-        import urllib.parse
+        loop = asyncio.get_running_loop()
+        # A stuck heartbeat must not hold up the loop
+        timeout = aiohttp.ClientTimeout(total=5)
+        retry_delay = None
 
         while True:
             try:
-                await asyncio.sleep(30)  # Send heartbeat every 30 seconds
+                if retry_delay is None:
+                    # Due one interval after the last contact with the hub
+                    due = self._last_heartbeat + self.HEARTBEAT_INTERVAL
+                    await asyncio.sleep(max(0.0, due - loop.time()))
+                    if self._last_heartbeat + self.HEARTBEAT_INTERVAL > due:
+                        # A registration reached the hub while we slept
+                        continue
+                else:
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = None
+
                 if not self.registered:
+                    # Registering refreshes the hub too, so the heartbeat can wait
+                    await self.register_with_hub()
+                    self._hb_backoff = 1.0
                     continue
 
-                # URL encode properly to avoid 404 errors
-                encoded_url = urllib.parse.quote(self.node_url, safe='')
-
                 # Send heartbeat request
-                async with self.session.post(f"{self.hub_url}/heartbeat/{encoded_url}") as resp:
+                await self.ensure_session()
+                async with self.session.post(self._heartbeat_url, timeout=timeout) as resp:
                     if resp.status != 200:
-                        print(f"⚠️ Heartbeat failed: {await resp.text()}")
-                        # If heartbeat failed, try to re-register
+                        logger.warning("Heartbeat failed: %s", await resp.text())
+                        # Re-register on the next tick, after backing off, so nodes
+                        # don't all hit the hub at once when it comes back
                         self.registered = False
-                        await self.register_with_hub()
+                        retry_delay = self._next_heartbeat_backoff()
                     else:
-                        print("💓 Heartbeat sent successfully")
+                        logger.debug("Heartbeat sent successfully")
+                        self._last_heartbeat = loop.time()
+                        self._hb_backoff = 1.0
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"❌ Error in heartbeat loop: {str(e)}")
-                await asyncio.sleep(5)  # Wait before retrying
+                logger.error("Error in heartbeat loop: %s", e)
+                retry_delay = self._next_heartbeat_backoff()
+
+    def _next_heartbeat_backoff(self) -> float:
+        """Return the delay before the next heartbeat attempt (decorrelated jitter, capped at 60s)."""
+        delay = min(60.0, self._hb_backoff * random.uniform(1.0, 3.0))
+        self._hb_backoff = delay
+        return delay
 
     def _generate_agent_card(self):
         """Generate the agent card for A2A protocol."""
-        # Convert local tools to skills
-        skills = []
-        for tool in self.local_tools:
-            skills.append({
-                "id": f"tool-{tool.get('name')}",
-                "name": tool.get('name'),
-                "description": tool.get('description', ''),
-                "tags": ["cognisphere", "tool"]
-            })
-
-        return {
-            "name": self.agent_name,
-            "description": self.agent_description,
-            "url": self.agent_url,
-            "skills": skills
-        }
+        if self._agent_card_cache is None:
+            self._agent_card_cache = {
+                "name": self.agent_name,
+                "description": self.agent_description,
+                "url": self.agent_url,
+                "skills": list(self._tool_skills)
+            }
+        return self._agent_card_cache
 
     def add_local_tool(self, tool: Dict[str, Any]):
         """
@@ -206,48 +348,116 @@ class CognisphereAiraClient:
         Args:
             tool: Dictionary with tool name, description, and implementation
         """
-        self.local_tools.append(tool)
-        logger.info(f"Added local tool: {tool.get('name')}")
+        self.add_local_tools([tool])
+
+    def add_local_tools(self, tools: List[Dict[str, Any]]):
+        """
+        Add several local tools to be exposed via AIRA in one update.
+
+        Args:
+            tools: Dictionaries with tool name, description, and implementation
+        """
+        for tool in tools:
+            self.local_tools.append(tool)
+            implementation = tool.get("implementation")
+            self._tool_lower_index.append((
+                tool.get("name", "").lower(),
+                tool,
+                implementation,
+                # Also covers callable objects with an async __call__
+                asyncio.iscoroutinefunction(implementation)
+                or asyncio.iscoroutinefunction(getattr(implementation, "__call__", None))
+            ))
+            self._tool_skills.append({
+                "id": f"tool-{tool.get('name')}",
+                "name": tool.get('name'),
+                "description": tool.get('description', ''),
+                "tags": ["cognisphere", "tool"]
+            })
+
+        # The card and registration payload are rebuilt once for the whole batch
+        self._agent_card_cache = None
+        self._registration_payload = None
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Added local tools: %s", ", ".join(str(t.get('name')) for t in tools))
 
     async def discover_agents(self):
+        if self._agents_cache and time.monotonic() - self._agents_cache[0] < self.agents_ttl:
+            return self._agents_cache[1]
+
         try:
             await self.ensure_session()
 
             async def _fetch_agents():
-                async with self.session.get(f"{self.hub_url}/agents") as resp:
+                async with self.session.get(self._agents_url) as resp:
 
                     if resp.status == 200:
-                        agents = await resp.json()
-                        print(f"🌐 Total Agents Found: {len(agents)}")
+                        agents = orjson.loads(await resp.read())
+                        logger.info("Total agents found: %s", len(agents))
                         filtered_agents = [a for a in agents if a.get("url") != self.agent_url]
-                        print(f"✅ Filtered Agents: {len(filtered_agents)}")
+                        logger.debug("Filtered agents: %s", len(filtered_agents))
+                        # Failures return [] below and are never cached
+                        self._agents_cache = (time.monotonic(), filtered_agents)
                         return filtered_agents
                     else:
                         error_text = await resp.text()
-                        print(f"❌ Discovery Failed: {error_text}")
+                        logger.warning("Discovery failed: %s", error_text)
                         return []
 
             # Simply await the _fetch_agents coroutine without wrapping it in wait_for:
             return await _fetch_agents()
         except asyncio.TimeoutError:
-            print("❌ Discovery timed out")
+            logger.error("Discovery timed out")
             return []
         except Exception as e:
-            print(f"❌ Discovery Exception: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Discovery exception: %s", e, exc_info=True)
             return []
 
     async def discover_agent_capabilities(self, agent_url: str):
         """
         Discover the capabilities of a specific agent.
 
+        Cards younger than card_fresh_ttl are served from cache. Cards younger
+        than card_stale_ttl are served from cache while a background fetch
+        refreshes them. Older or missing cards are fetched before returning.
+
         Args:
             agent_url: URL of the agent to discover
 
         Returns:
             Agent card with capabilities
         """
+        # Normalize URL
+        normalized_url = agent_url
+        if normalized_url.endswith('/'):
+            normalized_url = normalized_url[:-1]
+
+        entry = self._card_cache.get(normalized_url)
+        if entry:
+            age = time.monotonic() - entry[0]
+            if age < self.card_fresh_ttl:
+                return entry[1]
+            if age < self.card_stale_ttl:
+                refresh = self._card_refreshes.get(normalized_url)
+                # A refresh left pending on a loop that has since closed will never finish
+                if refresh is None or refresh.get_loop().is_closed():
+                    refresh = asyncio.create_task(self._fetch_agent_card(normalized_url))
+                    self._card_refreshes[normalized_url] = refresh
+                    # Forget the refresh once it finishes so the dict only holds live ones
+                    refresh.add_done_callback(
+                        lambda done: self._forget_card_refresh(normalized_url, done)
+                    )
+                return entry[1]
+
+        return await self._fetch_agent_card(normalized_url)
+
+    def _forget_card_refresh(self, normalized_url: str, done: asyncio.Task):
+        """Drop a finished background card refresh, unless a newer one replaced it."""
+        if self._card_refreshes.get(normalized_url) is done:
+            del self._card_refreshes[normalized_url]
+
+    async def _fetch_agent_card(self, normalized_url: str):
+        """Fetch an agent card and store it in the card cache."""
         try:
             # Ensure session exists
             await self.ensure_session()
@@ -256,23 +466,19 @@ class CognisphereAiraClient:
             from aiohttp import ClientTimeout
             timeout = ClientTimeout(total=30)
 
-            # Normalize URL
-            normalized_url = agent_url
-            if normalized_url.endswith('/'):
-                normalized_url = normalized_url[:-1]
-
             # Get agent card
             async with self.session.get(f"{normalized_url}/.well-known/agent.json", timeout=timeout) as resp:
                 if resp.status == 200:
-                    agent_card = await resp.json()
-                    logger.info(f"Discovered capabilities for agent at {agent_url}")
+                    agent_card = orjson.loads(await resp.read())
+                    self._card_cache[normalized_url] = (time.monotonic(), agent_card)
+                    logger.info("Discovered capabilities for agent at %s", normalized_url)
                     return agent_card
                 else:
                     error_text = await resp.text()
-                    logger.warning(f"Failed to get agent card: {error_text}")
+                    logger.warning("Failed to get agent card: %s", error_text)
                     return {}
         except Exception as e:
-            logger.error(f"Error discovering agent capabilities: {str(e)}")
+            logger.error("Error discovering agent capabilities: %s", e)
             return {}
 
     async def _safe_api_call(self, method, url, json_data=None, timeout=30):
@@ -300,7 +506,7 @@ class CognisphereAiraClient:
                             return await resp.json()
                         else:
                             error_text = await resp.text()
-                            logger.warning(f"API call failed: {error_text}")
+                            logger.warning("API call failed: %s", error_text)
                             return None
                 else:
                     async with request_method(url) as resp:
@@ -308,15 +514,15 @@ class CognisphereAiraClient:
                             return await resp.json()
                         else:
                             error_text = await resp.text()
-                            logger.warning(f"API call failed: {error_text}")
+                            logger.warning("API call failed: %s", error_text)
                             return None
 
             return await asyncio.wait_for(_do_request(), timeout=timeout)
         except asyncio.TimeoutError:
-            logger.error(f"API call to {url} timed out")
+            logger.error("API call to %s timed out", url)
             return None
         except Exception as e:
-            logger.error(f"Error in API call to {url}: {str(e)}")
+            logger.error("Error in API call to %s: %s", url, e)
             return None
 
     async def discover_agent_tools(self, agent_url: str):
@@ -329,19 +535,11 @@ class CognisphereAiraClient:
         Returns:
             List of tools with their metadata
         """
-        # Normalize URL
-        normalized_url = agent_url
-        if normalized_url.endswith('/'):
-            normalized_url = normalized_url[:-1]
-
-        # Get agent card using safe API call
-        agent_card = await self._safe_api_call(
-            'get',
-            f"{normalized_url}/.well-known/agent.json"
-        )
+        # Get agent card, served from the card cache when possible
+        agent_card = await self.discover_agent_capabilities(agent_url)
 
         if not agent_card:
-            logger.warning(f"No agent card found for {agent_url}")
+            logger.warning("No agent card found for %s", agent_url)
             return []
 
         agent_name = agent_card.get("name", "Unknown Agent")
@@ -360,13 +558,63 @@ class CognisphereAiraClient:
                     "parameters": tool_parameters
                 })
 
-                logger.info(f"Discovered tool: {tool_name} from {agent_name}")
+                logger.info("Discovered tool: %s from %s", tool_name, agent_name)
 
         # Store for later use
         self.discovered_tools[agent_url] = tools
         return tools
 
-    async def invoke_agent_tool(self, agent_url: str, tool_name: str, params: Dict[str, Any]):
+    async def discover_all_tools(self, max_concurrency: int = 32):
+        """
+        Discover the tools of every agent registered with the hub.
+
+        Agent cards are fetched concurrently, with at most max_concurrency
+        requests in flight.
+
+        Args:
+            max_concurrency: Maximum number of agent cards fetched at once
+
+        Returns:
+            Dictionary mapping agent URL to its list of tools
+        """
+        agents = await self.discover_agents()
+        agent_urls = [a["url"] for a in agents if a.get("url")]
+        results = await self.discover_tools_for_agents(agent_urls, max_concurrency)
+
+        all_tools = {}
+        for agent_url, result in zip(agent_urls, results):
+            if isinstance(result, Exception):
+                logger.error("Error discovering tools for %s: %s", agent_url, result)
+            else:
+                all_tools[agent_url] = result
+        return all_tools
+
+    async def discover_tools_for_agents(self, agent_urls: List[str], max_concurrency: int = 32):
+        """
+        Discover the tools of several agents concurrently.
+
+        Args:
+            agent_urls: URLs of the agents to discover tools from
+            max_concurrency: Maximum number of agent cards fetched at once
+
+        Returns:
+            One entry per URL, in order: its list of tools, or the exception raised for it
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(agent_url):
+            async with semaphore:
+                return await self.discover_agent_tools(agent_url)
+
+        return await asyncio.gather(*(_bounded(url) for url in agent_urls), return_exceptions=True)
+
+    async def invoke_agent_tool(
+            self,
+            agent_url: str,
+            tool_name: str,
+            params: Dict[str, Any],
+            coalesce: bool = False
+    ):
         """
         Invoke a tool on another agent.
 
@@ -374,13 +622,40 @@ class CognisphereAiraClient:
             agent_url: URL of the agent
             tool_name: Name of the tool to invoke
             params: Parameters for the tool
+            coalesce: Share one in-flight request between identical concurrent
+                calls. Only use this for idempotent tools.
 
         Returns:
             Tool result
         """
+        if not coalesce:
+            return await self._invoke_agent_tool(agent_url, tool_name, params)
+
+        try:
+            key = hashlib.blake2b(
+                f"{agent_url}|{tool_name}|".encode() + orjson.dumps(params, option=orjson.OPT_SORT_KEYS),
+                digest_size=16
+            ).digest()
+        except TypeError:
+            # Parameters that orjson can't canonicalize are never coalesced
+            return await self._invoke_agent_tool(agent_url, tool_name, params)
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._invoke_agent_tool(agent_url, tool_name, params))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(future)
+
+    async def _invoke_agent_tool(self, agent_url: str, tool_name: str, params: Dict[str, Any]):
+        """Send a single tasks/send request for invoke_agent_tool."""
         try:
+            await self.ensure_session()
+
             # Create a tasks/send request
-            task_id = f"task-{int(datetime.now().timestamp())}"
+            task_id = f"task-{next(self._task_seq)}"
 
             # Format the request for A2A protocol
             request = {
@@ -393,7 +668,7 @@ class CognisphereAiraClient:
                         "role": "user",
                         "parts": [{
                             "type": "text",
-                            "text": f"Use the {tool_name} tool with parameters: {json.dumps(params)}"
+                            "text": f"Use the {tool_name} tool with parameters: {_json_dumps(params)}"
                         }]
                     }
                 }
@@ -406,12 +681,12 @@ class CognisphereAiraClient:
                 else:
                     agent_url = agent_url + '/a2a'
 
-            logger.info(f"Invoking tool '{tool_name}' on agent at {agent_url}")
+            logger.info("Invoking tool '%s' on agent at %s", tool_name, agent_url)
 
             # Send the request
             async with self.session.post(agent_url, json=request) as resp:
                 if resp.status == 200:
-                    result = await resp.json()
+                    result = orjson.loads(await resp.read())
 
                     # Extract the result from the artifacts
                     if "result" in result:
@@ -419,25 +694,31 @@ class CognisphereAiraClient:
                         artifacts = task_result.get("artifacts", [])
 
                         if artifacts:
-                            # Get the text part from the first artifact
                             parts = artifacts[0].get("parts", [])
-                            text_part = next((p for p in parts if p.get("type") == "text"), None)
+
+                            # Structured data parts are already decoded with the envelope
+                            for part in parts:
+                                if part.get("type") == "data" and "data" in part:
+                                    return part["data"]
+
+                            # Otherwise get the text part from the first artifact
+                            text_part = _first_text_part(parts)
 
                             if text_part and "text" in text_part:
                                 try:
                                     # Try to parse as JSON
-                                    return json.loads(text_part["text"])
-                                except:
+                                    return orjson.loads(text_part["text"])
+                                except orjson.JSONDecodeError:
                                     # Return as plain text if not JSON
                                     return text_part["text"]
 
                     return result
                 else:
                     error_text = await resp.text()
-                    logger.warning(f"Failed to invoke tool: {error_text}")
+                    logger.warning("Failed to invoke tool: %s", error_text)
                     return {"error": f"Failed to invoke tool: {error_text}"}
         except Exception as e:
-            logger.error(f"Error invoking agent tool: {str(e)}")
+            logger.error("Error invoking agent tool: %s", e)
             return {"error": f"Error invoking tool: {str(e)}"}
 
     async def get_available_hubs(self):
@@ -476,48 +757,56 @@ class CognisphereAiraClient:
                 await self._heartbeat_task
             except asyncio.CancelledError:
                 pass
+            # Let the new registration start a fresh heartbeat
+            self._heartbeat_task = None
+
+        # The session is deliberately kept: its connector holds the DNS cache and
+        # idle keep-alive connections to agents, which stay valid across hubs
 
         # Update hub URL
         self.hub_url = new_hub_url.rstrip('/')
+        self._set_hub_urls()
         self.registered = False
 
         # Reset discovered agents and tools
+        self._agents_cache = None
         self.discovered_agents = {}
         self.discovered_tools = {}
 
         # Register with new hub
         await self.register_with_hub()
-        logger.info(f"Switched to new AIRA hub at {self.hub_url}")
+        logger.info("Switched to new AIRA hub at %s", self.hub_url)
 
-    async def handle_a2a_request(self, request_body: str):
+    async def handle_a2a_request(self, request_body: Union[str, bytes, Dict[str, Any]]):
         """
         Handle an incoming A2A request.
 
         Args:
-            request_body: JSON-RPC request body
+            request_body: JSON-RPC request body (raw JSON bytes, decoded text, or
+                a request already decoded from another wire format)
 
         Returns:
             JSON-RPC response
         """
+        request = {}
         try:
-            request = json.loads(request_body)
+            request = request_body if isinstance(request_body, dict) else orjson.loads(request_body)
             method = request.get("method")
 
-            if method == "tasks/send":
-                return await self._handle_tasks_send(request)
-            elif method == "tasks/get":
-                return await self._handle_tasks_get(request)
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method {method} not supported"
-                    }
+            handler = self._a2a_handlers.get(method)
+            if handler:
+                return await handler(request)
+
+            return {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "error": {
+                    "code": -32601,
+                    "message": f"Method {method} not supported"
                 }
+            }
         except Exception as e:
-            logger.error(f"Error handling A2A request: {str(e)}")
+            logger.error("Error handling A2A request: %s", e)
             return {
                 "jsonrpc": "2.0",
                 "id": request.get("id", None),
@@ -537,92 +826,85 @@ class CognisphereAiraClient:
         Returns:
             JSON-RPC response object
         """
-        params = request.get("params", {})
-        task_id = params.get("id")
-        message = params.get("message", {})
+        req_id = request.get("id")
+        try:
+            params = request["params"]
+            message = params["message"]
+            parts = message["parts"]
+            is_user = message["role"] == "user"
+        except (KeyError, TypeError):
+            return self._create_error_response("Invalid message format", req_id)
 
-        if message.get("role") != "user" or not message.get("parts"):
-            return self._create_error_response("Invalid message format", request.get("id"))
+        if not is_user or not parts:
+            return self._create_error_response("Invalid message format", req_id)
+
+        task_id = params.get("id")
+        session_id = params.get("sessionId") or f"session-{task_id or next(self._task_seq)}"
 
         # Extract the message text
-        text_part = next((p for p in message.get("parts", []) if p.get("type") == "text"), None)
+        text_part = _first_text_part(parts)
         if not text_part or not text_part.get("text"):
-            return self._create_error_response("No text content found", request.get("id"))
+            return self._create_error_response("No text content found", req_id)
 
         text = text_part.get("text")
 
         # Parse the message to identify tool request
         tool_name = None
-        params = {}
+        tool_impl = None
+        tool_is_async = False
+        tool_args = {}
 
         # Simple parsing - in a real implementation, you'd use a more sophisticated parser
-        for tool in self.local_tools:
-            if tool.get("name", "").lower() in text.lower():
+        text_lower = text.lower()
+        for name_lower, tool, implementation, is_async in self._tool_lower_index:
+            if name_lower in text_lower:
                 tool_name = tool.get("name")
+                tool_impl = implementation
+                tool_is_async = is_async
                 # Extract parameters if JSON structure is present
                 try:
                     json_start = text.find('{')
                     if json_start != -1:
                         json_part = text[json_start:]
-                        params = json.loads(json_part)
+                        tool_args = orjson.loads(json_part)
                 except:
                     # Simple parameter extraction fallback
-                    if "memory" in tool_name.lower() and "query" in text.lower():
-                        import re
-                        query_match = re.search(r'query[:\s]+([^\n]+)', text, re.IGNORECASE)
+                    if "memory" in name_lower and "query" in text_lower:
+                        query_match = _QUERY_RE.search(text)
                         if query_match:
-                            params["query"] = query_match.group(1).strip()
+                            tool_args["query"] = query_match.group(1).strip()
                 break
 
         if not tool_name:
             # No tool identified, return help message
-            return {
-                "jsonrpc": "2.0",
-                "id": request.get("id"),
-                "result": {
-                    "id": task_id,
-                    "sessionId": params.get("sessionId", f"session-{task_id}"),
-                    "status": {"state": "completed"},
-                    "artifacts": [{
-                        "parts": [{
-                            "type": "text",
-                            "text": f"I'm not sure which tool you want to use. Available tools: {', '.join(t.get('name') for t in self.local_tools)}"
-                        }]
-                    }]
-                }
-            }
-
-        # Find the tool implementation
-        tool_impl = next((t.get("implementation") for t in self.local_tools if t.get("name") == tool_name), None)
+            return self._make_task_response(
+                req_id,
+                task_id,
+                session_id,
+                f"I'm not sure which tool you want to use. Available tools: {', '.join(t.get('name') for t in self.local_tools)}"
+            )
+
+        # The implementation was picked up with the matching tool above
         if not tool_impl:
-            return self._create_error_response(f"Tool '{tool_name}' implementation not found", request.get("id"))
+            return self._create_error_response(f"Tool '{tool_name}' implementation not found", req_id)
 
         # Execute the tool
         try:
-            if asyncio.iscoroutinefunction(tool_impl):
-                result = await tool_impl(params)
+            if tool_is_async:
+                result = await tool_impl(tool_args)
             else:
-                result = tool_impl(params)
+                result = tool_impl(tool_args)
 
             # Format the result as an A2A task response
-            return {
-                "jsonrpc": "2.0",
-                "id": request.get("id"),
-                "result": {
-                    "id": task_id,
-                    "sessionId": params.get("sessionId", f"session-{task_id}"),
-                    "status": {"state": "completed"},
-                    "artifacts": [{
-                        "parts": [{
-                            "type": "text",
-                            "text": json.dumps(result, indent=2)
-                        }]
-                    }]
-                }
-            }
+            return self._make_task_response(
+                req_id,
+                task_id,
+                session_id,
+                orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode()
+            )
         except Exception as e:
-            logger.error(f"Error executing tool {tool_name}: {e}")
-            return self._create_error_response(f"Error executing tool: {str(e)}", request.get("id"))
+            logger.error("Error executing tool %s: %s", tool_name, e)
+            return self._create_error_response(f"Error executing tool: {str(e)}", req_id)
 
     async def _handle_tasks_get(self, request):
         """
@@ -651,6 +933,36 @@ class CognisphereAiraClient:
             }
         }
 
+    @staticmethod
+    def _make_task_response(req_id, task_id, session_id, text):
+        """
+        Create a JSON-RPC response for a completed task with a single text artifact.
+
+        Args:
+            req_id: Request ID
+            task_id: Task ID
+            session_id: Session ID
+            text: Text of the artifact
+
+        Returns:
+            JSON-RPC response object
+        """
+        return {
+            "jsonrpc": "2.0",
+            "id": req_id,
+            "result": {
+                "id": task_id,
+                "sessionId": session_id,
+                "status": {"state": "completed"},
+                "artifacts": [{
+                    "parts": [{
+                        "type": "text",
+                        "text": text
+                    }]
+                }]
+            }
+        }
+
     def _create_error_response(self, message, req_id):
         """
         Create a JSON-RPC error response.
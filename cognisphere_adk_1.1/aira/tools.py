@@ -7,6 +7,9 @@ Provides both tools for Cognisphere to expose its capabilities and to consume to
 """
 
 import json
+import asyncio
+import functools
+from collections import defaultdict
 from typing import Dict, List, Any, Optional
 from google.adk.tools import BaseTool, FunctionTool
 from google.adk.tools.tool_context import ToolContext
@@ -18,6 +21,14 @@ from .client import CognisphereAiraClient
 aira_client = None
 
 
+class _MockToolContext:
+    """Minimal stand-in for ToolContext when AIRA calls a Cognisphere tool."""
+    __slots__ = ("state",)
+
+    def __init__(self):
+        self.state = {}
+
+
 def setup_aira_client(hub_url: str, agent_url: str, agent_name: str = "Cognisphere"):
     """
     Initialize the global AIRA client.
@@ -38,6 +49,24 @@ def setup_aira_client(hub_url: str, agent_url: str, agent_name: str = "Cognisphe
 
 # ======== Tools for consuming AIRA agents ========
 
+# Most agents the bulk discovery tools query at the same time
+_DISCOVERY_CONCURRENCY = 8
+
+
+async def _discover_tools_bounded(agent_urls: List[str]) -> List[Any]:
+    """
+    Discover the tools of several agents concurrently, a bounded number at a time.
+
+    Returns one entry per URL: the tool list, or the exception raised for that agent.
+    """
+    semaphore = asyncio.Semaphore(_DISCOVERY_CONCURRENCY)
+
+    async def _discover(agent_url):
+        async with semaphore:
+            return await aira_client.discover_agent_tools(agent_url)
+
+    return await asyncio.gather(*(_discover(url) for url in agent_urls), return_exceptions=True)
+
 async def discover_aira_agents(tool_context: ToolContext) -> Dict[str, Any]:
     """
     Discover agents on the AIRA network.
@@ -52,21 +81,69 @@ async def discover_aira_agents(tool_context: ToolContext) -> Dict[str, Any]:
         return {"error": "AIRA client not initialized. Call setup_aira_client first."}
 
     try:
+        # The client caches the hub's agent list (and agent cards) itself
         agents = await aira_client.discover_agents()
 
         # Format results for readability
+        agent_info = [
+            {
+                "name": agent.get("name", "Unknown"),
+                "url": agent.get("url", ""),
+                "description": agent.get("description", ""),
+                "status": agent.get("status", "unknown")
+            }
+            for agent in agents
+        ]
+
+        # Store in session state for later use
+        if tool_context:
+            tool_context.state["aira_discovered_agents"] = {a["url"]: a for a in agent_info}
+
+        return {
+            "status": "success",
+            "count": len(agent_info),
+            "agents": agent_info
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error discovering agents: {str(e)}"
+        }
+
+
+async def discover_aira_agents_with_tools(tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Discover agents on the AIRA network together with the tools each one offers.
+
+    Args:
+        tool_context: Tool context from ADK
+
+    Returns:
+        Dictionary with discovered agents, each including its tools
+    """
+    if not aira_client:
+        return {"error": "AIRA client not initialized. Call setup_aira_client first."}
+
+    try:
+        agents = await aira_client.discover_agents()
+
+        # The tool lookups only depend on the agent list, so run them concurrently
+        tools_per_agent = await _discover_tools_bounded([agent.get("url", "") for agent in agents])
+
         agent_info = []
-        for agent in agents:
+        for agent, tools in zip(agents, tools_per_agent):
             agent_info.append({
                 "name": agent.get("name", "Unknown"),
                 "url": agent.get("url", ""),
                 "description": agent.get("description", ""),
-                "status": agent.get("status", "unknown")
+                "status": agent.get("status", "unknown"),
+                "tools": [] if isinstance(tools, Exception) else tools
             })
 
         # Store in session state for later use
         if tool_context:
             tool_context.state["aira_discovered_agents"] = {a["url"]: a for a in agent_info}
+            tool_context.state["aira_discovered_tools"] = {a["url"]: a["tools"] for a in agent_info}
 
         return {
             "status": "success",
@@ -99,9 +176,9 @@ async def discover_aira_tools(agent_url: str, tool_context: ToolContext) -> Dict
 
         # Store in session state for later use
         if tool_context:
-            if "aira_discovered_tools" not in tool_context.state:
-                tool_context.state["aira_discovered_tools"] = {}
-            tool_context.state["aira_discovered_tools"][agent_url] = tools
+            discovered = tool_context.state.get("aira_discovered_tools", {})
+            discovered[agent_url] = tools
+            tool_context.state["aira_discovered_tools"] = discovered
 
         agent_name = "Unknown"
         if agent_url in aira_client.discovered_agents:
@@ -121,6 +198,53 @@ async def discover_aira_tools(agent_url: str, tool_context: ToolContext) -> Dict
         }
 
 
+async def discover_aira_tools_bulk(agent_urls: List[str], tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Discover tools offered by several agents on the AIRA network at once.
+
+    Args:
+        agent_urls: URLs of the agents to discover tools from
+        tool_context: Tool context from ADK
+
+    Returns:
+        Dictionary with discovered tools per agent
+    """
+    if not aira_client:
+        return {"error": "AIRA client not initialized. Call setup_aira_client first."}
+
+    # Query the agents concurrently so the wait is close to the slowest agent, not the sum
+    results = await _discover_tools_bounded(agent_urls)
+
+    agents = {}
+    discovered = {}
+    for agent_url, result in zip(agent_urls, results):
+        if isinstance(result, Exception):
+            agents[agent_url] = {
+                "status": "error",
+                "message": f"Error discovering tools: {str(result)}"
+            }
+        else:
+            discovered[agent_url] = result
+            agents[agent_url] = {
+                "status": "success",
+                "count": len(result),
+                "tools": result
+            }
+
+    # Store in session state for later use
+    if tool_context:
+        tool_context.state["aira_discovered_tools"] = {
+            **tool_context.state.get("aira_discovered_tools", {}),
+            **discovered
+        }
+
+    return {
+        "status": "success",
+        "count": len(discovered),
+        "agents": agents
+    }
+
+
 async def invoke_aira_tool(
         agent_url: str,
         tool_name: str,
@@ -168,6 +292,87 @@ async def invoke_aira_tool(
         }
 
 
+def _batch_call_problem(call: Any) -> Optional[str]:
+    """Describe what is wrong with one batch_invoke_aira_tool call, or None if it is usable."""
+    if not isinstance(call, dict):
+        return "Each call must be an object with agent_url, tool_name and parameters"
+    if not call.get("agent_url") or not call.get("tool_name"):
+        return "Missing required parameters: agent_url and tool_name are required"
+    if not isinstance(call["agent_url"], str) or not isinstance(call["tool_name"], str):
+        return "agent_url and tool_name must be strings"
+    parameters = call.get("parameters")
+    if parameters is not None and not isinstance(parameters, dict):
+        return "parameters must be an object"
+    return None
+
+
+async def batch_invoke_aira_tool(calls: List[Dict[str, Any]], tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Invoke several tools on agents of the AIRA network at once.
+
+    Args:
+        calls: List of calls, each with agent_url, tool_name and parameters
+        tool_context: Tool context from ADK
+
+    Returns:
+        Dictionary with one result per call, in the order of calls
+    """
+    if not aira_client:
+        return {"error": "AIRA client not initialized. Call setup_aira_client first."}
+
+    if not isinstance(calls, list):
+        return {"status": "error", "message": "calls must be a list of tool calls"}
+
+    results = [None] * len(calls)
+
+    # Group the calls by agent so each agent's calls are sent together; malformed
+    # calls get their own error entry instead of failing the whole batch
+    groups = defaultdict(list)
+    for index, call in enumerate(calls):
+        problem = _batch_call_problem(call)
+        if problem:
+            entry = {"status": "error", "message": problem}
+            if isinstance(call, dict):
+                entry["agent_url"] = call.get("agent_url", "")
+                entry["tool_name"] = call.get("tool_name", "")
+            results[index] = entry
+        else:
+            groups[call["agent_url"]].append((index, call))
+
+    async def _invoke_group(agent_url, group):
+        return await asyncio.gather(
+            *(aira_client.invoke_agent_tool(agent_url, call["tool_name"], call.get("parameters") or {})
+              for _, call in group),
+            return_exceptions=True
+        )
+
+    group_results = await asyncio.gather(*(_invoke_group(url, group) for url, group in groups.items()))
+
+    for group, outcomes in zip(groups.values(), group_results):
+        for (index, call), outcome in zip(group, outcomes):
+            entry = {
+                "agent_url": call["agent_url"],
+                "tool_name": call["tool_name"]
+            }
+            if isinstance(outcome, Exception):
+                entry["status"] = "error"
+                entry["message"] = f"Error invoking tool: {str(outcome)}"
+            else:
+                entry["status"] = "success"
+                entry["result"] = outcome
+            results[index] = entry
+
+    # Store last invocation results in session state
+    if tool_context:
+        tool_context.state["aira_last_batch_invocation"] = results
+
+    return {
+        "status": "success",
+        "count": len(results),
+        "results": results
+    }
+
+
 async def get_aira_hubs(tool_context: ToolContext) -> Dict[str, Any]:
     """
     Get available AIRA hubs.
@@ -241,32 +446,115 @@ async def switch_aira_hub(hub_url: str, tool_context: ToolContext) -> Dict[str,
 
 # ======== Create ADK tools ========
 
-# Tool for discovering AIRA agents
-discover_agents_tool = FunctionTool(discover_aira_agents)
-
-# Tool for discovering tools from an agent
-discover_tools_tool = FunctionTool(discover_aira_tools)
-
-# Tool for invoking a tool from an agent
-invoke_tool_tool = FunctionTool(invoke_aira_tool)
+# ADK tool name -> wrapped function, in the order the tools are listed.
+# The FunctionTool objects are only built the first time they are needed.
+_AIRA_TOOL_FUNCTIONS = {
+    # Tool for discovering AIRA agents
+    "discover_agents_tool": discover_aira_agents,
+    # Tool for discovering AIRA agents along with their tools
+    "discover_agents_with_tools_tool": discover_aira_agents_with_tools,
+    # Tool for discovering tools from an agent
+    "discover_tools_tool": discover_aira_tools,
+    # Tool for discovering tools from several agents at once
+    "discover_tools_bulk_tool": discover_aira_tools_bulk,
+    # Tool for invoking a tool from an agent
+    "invoke_tool_tool": invoke_aira_tool,
+    # Tool for invoking several tools in one call
+    "batch_invoke_tool_tool": batch_invoke_aira_tool,
+    # Tool for getting available AIRA hubs
+    "get_hubs_tool": get_aira_hubs,
+    # Tool for switching AIRA hub
+    "switch_hub_tool": switch_aira_hub
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_aira_tools() -> List[FunctionTool]:
+    """Return the list of all AIRA tools, creating them on first use."""
+    return [FunctionTool(func) for func in _AIRA_TOOL_FUNCTIONS.values()]
+
+
+def __getattr__(name):
+    # Keep aira_tools and the individual *_tool names importable
+    if name == "aira_tools":
+        return get_aira_tools()
+    if name in _AIRA_TOOL_FUNCTIONS:
+        return get_aira_tools()[list(_AIRA_TOOL_FUNCTIONS).index(name)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Tool for getting available AIRA hubs
-get_hubs_tool = FunctionTool(get_aira_hubs)
 
-# Tool for switching AIRA hub
-switch_hub_tool = FunctionTool(switch_aira_hub)
-
-# List of all AIRA tools
-aira_tools = [
-    discover_agents_tool,
-    discover_tools_tool,
-    invoke_tool_tool,
-    get_hubs_tool,
-    switch_hub_tool
-]
+# ======== Functions to expose Cognisphere tools to AIRA ========
 
+# Client the Cognisphere tools were last registered with
+_registered_client = None
+
+# Tool specs exposed to AIRA; adapters add their implementation when registering
+_RECALL_MEMORIES_SPEC = {
+    "name": "recall_memories",
+    "description": "Recall memories based on a query",
+    "parameters": {
+        "query": "The search query for finding memories",
+        "limit": "Maximum number of memories to return",
+        "include_all_identities": "Whether to include memories from all identities"
+    }
+}
+
+_CREATE_MEMORY_SPEC = {
+    "name": "create_memory",
+    "description": "Create a new memory in the Cognisphere system",
+    "parameters": {
+        "content": "The content of the memory",
+        "memory_type": "Type of memory (explicit, emotional, flashbulb, etc.)",
+        "emotion_type": "The primary emotion associated with the memory",
+        "emotion_score": "Intensity of the emotion (0.0-1.0)"
+    }
+}
+
+_CREATE_NARRATIVE_THREAD_SPEC = {
+    "name": "create_narrative_thread",
+    "description": "Create a new narrative thread in Cognisphere",
+    "parameters": {
+        "title": "The title of the narrative thread",
+        "theme": "The theme/category of the thread",
+        "description": "A description of the thread"
+    }
+}
+
+_ADD_THREAD_EVENT_SPEC = {
+    "name": "add_thread_event",
+    "description": "Add an event to a narrative thread in Cognisphere",
+    "parameters": {
+        "thread_id": "ID of the thread to add to",
+        "content": "Content of the event",
+        "emotion": "Emotional context of the event",
+        "impact": "Impact/significance score (0.0-1.0)"
+    }
+}
+
+_GET_ACTIVE_THREADS_SPEC = {
+    "name": "get_active_threads",
+    "description": "Get active narrative threads from Cognisphere",
+    "parameters": {
+        "limit": "Maximum number of threads to return"
+    }
+}
+
+_GENERATE_NARRATIVE_SUMMARY_SPEC = {
+    "name": "generate_narrative_summary",
+    "description": "Generate a summary of a narrative thread in Cognisphere",
+    "parameters": {
+        "thread_id": "ID of the thread to summarize"
+    }
+}
+
+_ANALYZE_EMOTION_SPEC = {
+    "name": "analyze_emotion",
+    "description": "Analyze the emotional content of text",
+    "parameters": {
+        "text": "The text to analyze"
+    }
+}
 
-# ======== Functions to expose Cognisphere tools to AIRA ========
 
 def register_memory_tools_with_aira():
     """Register Cognisphere memory tools with AIRA."""
@@ -295,30 +583,13 @@ def register_memory_tools_with_aira():
         limit = params.get("limit", 5)
         include_all_identities = params.get("include_all_identities", False)
 
-        # We need to create a mock ToolContext
-        # In a real implementation, you'd use a proper context or session state
-        class MockToolContext:
-            def __init__(self):
-                self.state = {}
-
-        mock_context = MockToolContext()
+        # Adapters run outside ADK, so give the tool a bare context with fresh state
+        mock_context = _MockToolContext()
 
         # Call the actual tool
         result = await recall_memories(mock_context, query, limit, None, None, include_all_identities)
         return result
 
-    # Register the tool with AIRA
-    aira_client.add_local_tool({
-        "name": "recall_memories",
-        "description": "Recall memories based on a query",
-        "implementation": aira_recall_memories,
-        "parameters": {
-            "query": "The search query for finding memories",
-            "limit": "Maximum number of memories to return",
-            "include_all_identities": "Whether to include memories from all identities"
-        }
-    })
-
     # Example adapter for create_memory
     async def aira_create_memory(params):
         content = params.get("content", "")
@@ -327,28 +598,17 @@ def register_memory_tools_with_aira():
         emotion_score = params.get("emotion_score", 0.5)
 
         # Mock tool context
-        class MockToolContext:
-            def __init__(self):
-                self.state = {}
-
-        mock_context = MockToolContext()
+        mock_context = _MockToolContext()
 
         # Call the actual tool
         result = await create_memory(mock_context, content, memory_type, emotion_type, emotion_score)
         return result
 
-    # Register the tool with AIRA
-    aira_client.add_local_tool({
-        "name": "create_memory",
-        "description": "Create a new memory in the Cognisphere system",
-        "implementation": aira_create_memory,
-        "parameters": {
-            "content": "The content of the memory",
-            "memory_type": "Type of memory (explicit, emotional, flashbulb, etc.)",
-            "emotion_type": "The primary emotion associated with the memory",
-            "emotion_score": "Intensity of the emotion (0.0-1.0)"
-        }
-    })
+    # Register the tools with AIRA in one update
+    aira_client.add_local_tools([
+        {**_RECALL_MEMORIES_SPEC, "implementation": aira_recall_memories},
+        {**_CREATE_MEMORY_SPEC, "implementation": aira_create_memory}
+    ])
 
 
 def register_narrative_tools_with_aira():
@@ -395,28 +655,12 @@ def register_narrative_tools_with_aira():
         description = params.get("description", "")
 
         # Mock tool context
-        class MockToolContext:
-            def __init__(self):
-                self.state = {}
-
-        mock_context = MockToolContext()
+        mock_context = _MockToolContext()
 
         # Call the actual tool
         result = await create_narrative_thread(title, theme, description, None, mock_context)
         return result
 
-    # Register the tool with AIRA
-    aira_client.add_local_tool({
-        "name": "create_narrative_thread",
-        "description": "Create a new narrative thread in Cognisphere",
-        "implementation": aira_create_narrative_thread,
-        "parameters": {
-            "title": "The title of the narrative thread",
-            "theme": "The theme/category of the thread",
-            "description": "A description of the thread"
-        }
-    })
-
     # Adapter for add_thread_event
     async def aira_add_thread_event(params):
         thread_id = params.get("thread_id", "")
@@ -425,78 +669,41 @@ def register_narrative_tools_with_aira():
         impact = params.get("impact", 0.5)
 
         # Mock tool context
-        class MockToolContext:
-            def __init__(self):
-                self.state = {}
-
-        mock_context = MockToolContext()
+        mock_context = _MockToolContext()
 
         # Call the actual tool
         result = await add_thread_event(thread_id, content, emotion, impact, None, mock_context)
         return result
 
-    # Register the tool with AIRA
-    aira_client.add_local_tool({
-        "name": "add_thread_event",
-        "description": "Add an event to a narrative thread in Cognisphere",
-        "implementation": aira_add_thread_event,
-        "parameters": {
-            "thread_id": "ID of the thread to add to",
-            "content": "Content of the event",
-            "emotion": "Emotional context of the event",
-            "impact": "Impact/significance score (0.0-1.0)"
-        }
-    })
-
     # Adapter for get_active_threads
     async def aira_get_active_threads(params):
         limit = params.get("limit", 5)
 
         # Mock tool context
-        class MockToolContext:
-            def __init__(self):
-                self.state = {}
-
-        mock_context = MockToolContext()
+        mock_context = _MockToolContext()
 
         # Call the actual tool
         result = await get_active_threads(limit, None, mock_context)
         return result
 
-    # Register the tool with AIRA
-    aira_client.add_local_tool({
-        "name": "get_active_threads",
-        "description": "Get active narrative threads from Cognisphere",
-        "implementation": aira_get_active_threads,
-        "parameters": {
-            "limit": "Maximum number of threads to return"
-        }
-    })
-
     # Adapter for generate_narrative_summary
     async def aira_generate_narrative_summary(params):
         thread_id = params.get("thread_id")
 
         # Mock tool context
-        class MockToolContext:
-            def __init__(self):
-                self.state = {}
-
-        mock_context = MockToolContext()
+        mock_context = _MockToolContext()
 
         # Call the actual tool
         result = await generate_narrative_summary(thread_id, None, mock_context)
         return result
 
-    # Register the tool with AIRA
-    aira_client.add_local_tool({
-        "name": "generate_narrative_summary",
-        "description": "Generate a summary of a narrative thread in Cognisphere",
-        "implementation": aira_generate_narrative_summary,
-        "parameters": {
-            "thread_id": "ID of the thread to summarize"
-        }
-    })
+    # Register the tools with AIRA in one update
+    aira_client.add_local_tools([
+        {**_CREATE_NARRATIVE_THREAD_SPEC, "implementation": aira_create_narrative_thread},
+        {**_ADD_THREAD_EVENT_SPEC, "implementation": aira_add_thread_event},
+        {**_GET_ACTIVE_THREADS_SPEC, "implementation": aira_get_active_threads},
+        {**_GENERATE_NARRATIVE_SUMMARY_SPEC, "implementation": aira_generate_narrative_summary}
+    ])
 
 
 def register_emotion_tools_with_aira():
@@ -530,20 +737,20 @@ def register_emotion_tools_with_aira():
         return result
 
     # Register the tool with AIRA
-    aira_client.add_local_tool({
-        "name": "analyze_emotion",
-        "description": "Analyze the emotional content of text",
-        "implementation": aira_analyze_emotion,
-        "parameters": {
-            "text": "The text to analyze"
-        }
-    })
+    aira_client.add_local_tool({**_ANALYZE_EMOTION_SPEC, "implementation": aira_analyze_emotion})
 
 
 def register_all_cognisphere_tools_with_aira():
     """Register all Cognisphere tools with AIRA."""
+    global _registered_client
+
+    # Registering twice with the same client would duplicate every tool
+    if aira_client is None or _registered_client is aira_client:
+        return
+
     register_memory_tools_with_aira()
     register_narrative_tools_with_aira()
     register_emotion_tools_with_aira()
+    _registered_client = aira_client
 
     print(f"Registered {len(aira_client.local_tools)} Cognisphere tools with AIRA")
\ No newline at end of file
@@ -0,0 +1,373 @@
+// static/js/aira.js
+// AIRA Network panel. Loaded with defer, so the DOM is parsed before it runs.
+document.addEventListener('DOMContentLoaded', () => {
+    // AIRA Network elements
+    const airaStatusIndicator = document.getElementById('aira-status-indicator');
+    const airaStatusText = document.getElementById('aira-status-text');
+    const airaConnectForm = document.getElementById('aira-connect-form');
+    const airaConnectedUI = document.getElementById('aira-connected-ui');
+    const airaHubUrlInput = document.getElementById('aira-hub-url');
+    const airaAgentUrlInput = document.getElementById('aira-agent-url');
+    const airaConnectBtn = document.getElementById('aira-connect-btn');
+    const airaDisconnectBtn = document.getElementById('aira-disconnect-btn');
+    const airaDiscoverBtn = document.getElementById('aira-discover-btn');
+    const airaDiscoveryResults = document.getElementById('aira-discovery-results');
+    const airaAgentsList = document.getElementById('aira-agents-list');
+    const airaAgentTools = document.getElementById('aira-agent-tools');
+    const airaToolsList = document.getElementById('aira-tools-list');
+
+    // How long a /api/aira/status result is reused before asking the server again
+    const AIRA_STATUS_TTL = 5000;
+    let airaStatusRequest = null;
+    let airaStatusCached = null;
+    let airaStatusCachedAt = 0;
+
+    // Check AIRA status on load
+    checkAiraStatus();
+
+    // Refresh the status when the tab becomes visible again; hidden tabs don't ask
+    document.addEventListener('visibilitychange', () => {
+        if (document.visibilityState === 'visible') {
+            checkAiraStatus();
+        }
+    });
+
+    // ------------ AIRA Network Functions ------------
+
+    // Check AIRA status
+    async function checkAiraStatus() {
+        if (airaStatusCached && Date.now() - airaStatusCachedAt < AIRA_STATUS_TTL) {
+            updateAiraStatus(airaStatusCached.connected, airaStatusCached.hub_url);
+            return;
+        }
+
+        // Concurrent checks share one request
+        if (!airaStatusRequest) {
+            airaStatusRequest = fetch('/api/aira/status')
+                .then(response => response.json())
+                .then(result => {
+                    airaStatusCached = result;
+                    airaStatusCachedAt = Date.now();
+                    return result;
+                })
+                .finally(() => {
+                    airaStatusRequest = null;
+                });
+        }
+
+        try {
+            const result = await airaStatusRequest;
+
+            updateAiraStatus(result.connected, result.hub_url);
+        } catch (error) {
+            console.error('Error checking AIRA status:', error);
+            updateAiraStatus(false);
+        }
+    }
+
+    // Update AIRA status UI
+    function updateAiraStatus(connected, hubUrl = '') {
+        if (connected) {
+            airaStatusIndicator.className = 'status-indicator status-online';
+            airaStatusText.textContent = `Connected to ${hubUrl}`;
+            airaConnectForm.style.display = 'none';
+            airaConnectedUI.style.display = 'block';
+        } else {
+            airaStatusIndicator.className = 'status-indicator status-offline';
+            airaStatusText.textContent = 'Not connected';
+            airaConnectForm.style.display = 'block';
+            airaConnectedUI.style.display = 'none';
+            airaDiscoveryResults.style.display = 'none';
+            airaAgentTools.style.display = 'none';
+        }
+    }
+
+    // Connect to AIRA hub
+    airaConnectBtn.addEventListener('click', async () => {
+        const hubUrl = airaHubUrlInput.value.trim();
+        const agentUrl = airaAgentUrlInput.value.trim();
+
+        if (!hubUrl || !agentUrl) {
+            alert('Please enter both the AIRA Hub URL and Agent URL');
+            return;
+        }
+
+        // The cached status is about to change
+        airaStatusCached = null;
+
+        try {
+            console.log("Attempting to connect to AIRA hub:", hubUrl);
+            airaConnectBtn.disabled = true;
+            airaConnectBtn.textContent = 'Connecting...';
+
+            const response = await fetch('/api/aira/connect', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({
+                    hub_url: hubUrl,
+                    agent_url: agentUrl
+                })
+            });
+
+            console.log("AIRA connection response status:", response.status);
+            const result = await response.json();
+            console.log("AIRA connection result:", result);
+
+            if (response.ok) {
+                updateAiraStatus(true, hubUrl);
+                addMessageToChat('assistant', `Connected to AIRA hub at ${hubUrl}`);
+            } else {
+                console.error("Error connecting to AIRA hub:", result.error);
+                alert(`Error connecting to AIRA hub: ${result.error}`);
+                updateAiraStatus(false);
+            }
+        } catch (error) {
+            console.error("Exception in AIRA connection:", error);
+            alert(`Error: ${error.message}`);
+            updateAiraStatus(false);
+        } finally {
+            airaConnectBtn.disabled = false;
+            airaConnectBtn.textContent = 'Connect to AIRA Hub';
+        }
+    });
+
+    // Disconnect from AIRA hub
+    airaDisconnectBtn.addEventListener('click', async () => {
+        // The cached status is about to change
+        airaStatusCached = null;
+
+        try {
+            airaDisconnectBtn.disabled = true;
+
+            const response = await fetch('/api/aira/disconnect', {
+                method: 'POST'
+            });
+
+            const result = await response.json();
+
+            if (response.ok) {
+                updateAiraStatus(false);
+                airaDiscoveryResults.style.display = 'none';
+                airaAgentTools.style.display = 'none';
+                addMessageToChat('assistant', 'Disconnected from AIRA hub');
+            } else {
+                alert(`Error disconnecting from AIRA hub: ${result.error}`);
+            }
+        } catch (error) {
+            alert(`Error: ${error.message}`);
+        } finally {
+            airaDisconnectBtn.disabled = false;
+        }
+    });
+
+    // Discover AIRA agents
+    airaDiscoverBtn.addEventListener('click', async () => {
+        try {
+            airaDiscoverBtn.disabled = true;
+            airaDiscoverBtn.textContent = 'Discovering...';
+
+            const response = await fetch('/api/aira/discover/agents');
+
+            const result = await response.json();
+
+            if (response.ok) {
+                displayAgents(result.agents);
+                airaDiscoveryResults.style.display = 'block';
+                addMessageToChat('assistant', `Discovered ${result.agents.length} agents on the AIRA network`);
+            } else {
+                alert(`Error discovering agents: ${result.error}`);
+            }
+        } catch (error) {
+            alert(`Error: ${error.message}`);
+        } finally {
+            airaDiscoverBtn.disabled = false;
+            airaDiscoverBtn.textContent = 'Discover Agents';
+        }
+    });
+
+    // Discover the tools of an agent. One listener on the list handles every
+    // agent's button, so re-rendering the list doesn't add listeners
+    airaAgentsList.addEventListener('click', async (event) => {
+        const button = event.target.closest('.discover-tools-btn');
+        if (!button) {
+            return;
+        }
+
+        const agentUrl = button.dataset.url;
+
+        try {
+            button.disabled = true;
+            button.textContent = 'Discovering...';
+
+            const response = await fetch(`/api/aira/discover/tools?agent_url=${encodeURIComponent(agentUrl)}`);
+
+            const result = await response.json();
+
+            if (response.ok) {
+                displayTools(result.tools, agentUrl, result.agent_name);
+                airaAgentTools.style.display = 'block';
+            } else {
+                alert(`Error discovering tools: ${result.error}`);
+            }
+        } catch (error) {
+            alert(`Error: ${error.message}`);
+        } finally {
+            button.disabled = false;
+            button.textContent = 'Discover Tools';
+        }
+    });
+
+    // Invoke a tool from an agent
+    airaToolsList.addEventListener('click', async (event) => {
+        const button = event.target.closest('.invoke-tool-btn');
+        if (!button) {
+            return;
+        }
+
+        const agentUrl = button.dataset.agentUrl;
+        const toolName = button.dataset.toolName;
+
+        // Get parameters
+        const paramInputs = button.parentElement.querySelectorAll('.param-input');
+        const parameters = {};
+
+        paramInputs.forEach(input => {
+            parameters[input.dataset.param] = input.value.trim();
+        });
+
+        try {
+            button.disabled = true;
+            button.textContent = 'Invoking...';
+
+            const response = await fetch('/api/aira/invoke', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({
+                    agent_url: agentUrl,
+                    tool_name: toolName,
+                    parameters: parameters
+                })
+            });
+
+            const result = await response.json();
+
+            if (response.ok) {
+                // Add the result to the chat
+                const resultText = typeof result.result === 'object'
+                    ? JSON.stringify(result.result, null, 2)
+                    : result.result;
+
+                addMessageToChat('assistant', `Tool result from ${toolName}:\n\n${resultText}`);
+            } else {
+                alert(`Error invoking tool: ${result.error}`);
+            }
+        } catch (error) {
+            alert(`Error: ${error.message}`);
+        } finally {
+            button.disabled = false;
+            button.textContent = 'Invoke Tool';
+        }
+    });
+
+    // Display discovered agents
+    function displayAgents(agents) {
+        if (agents.length === 0) {
+            airaAgentsList.innerHTML = '<p>No agents found</p>';
+            return;
+        }
+
+        // Build the list off-document and swap it in once. Text from remote
+        // agents goes through textContent so it is never parsed as HTML
+        const fragment = document.createDocumentFragment();
+
+        for (const agent of agents) {
+            const agentItem = document.createElement('div');
+            agentItem.className = 'agent-item';
+
+            const name = document.createElement('h4');
+            name.textContent = agent.name;
+
+            const description = document.createElement('p');
+            description.textContent = agent.description || 'No description';
+
+            const button = document.createElement('button');
+            button.className = 'action discover-tools-btn';
+            button.dataset.url = agent.url;
+            button.textContent = 'Discover Tools';
+
+            agentItem.append(name, description, button);
+            fragment.appendChild(agentItem);
+        }
+
+        airaAgentsList.replaceChildren(fragment);
+    }
+
+    // Display agent tools
+    function displayTools(tools, agentUrl, agentName) {
+        if (!tools || tools.length === 0) {
+            const empty = document.createElement('p');
+            empty.textContent = `No tools found for ${agentName || 'agent'}`;
+            airaToolsList.replaceChildren(empty);
+            return;
+        }
+
+        // Same approach as displayAgents: one insertion, no HTML parsing of remote text
+        const fragment = document.createDocumentFragment();
+
+        const heading = document.createElement('h4');
+        heading.textContent = `Tools from ${agentName || 'agent'}`;
+        fragment.appendChild(heading);
+
+        for (const tool of tools) {
+            const toolItem = document.createElement('div');
+            toolItem.className = 'tool-item';
+
+            const name = document.createElement('h5');
+            name.textContent = tool.name;
+
+            const description = document.createElement('p');
+            description.textContent = tool.description || 'No description';
+
+            toolItem.append(name, description);
+
+            // Create parameters display
+            if (tool.parameters && Object.keys(tool.parameters).length > 0) {
+                const params = document.createElement('div');
+                params.className = 'tool-params';
+
+                for (const key of Object.keys(tool.parameters)) {
+                    const paramItem = document.createElement('div');
+                    paramItem.className = 'param-item';
+
+                    const label = document.createElement('label');
+                    label.textContent = `${key}:`;
+
+                    const input = document.createElement('input');
+                    input.type = 'text';
+                    input.className = 'param-input';
+                    input.dataset.param = key;
+
+                    paramItem.append(label, input);
+                    params.appendChild(paramItem);
+                }
+
+                toolItem.appendChild(params);
+            }
+
+            const button = document.createElement('button');
+            button.className = 'action invoke-tool-btn';
+            button.dataset.agentUrl = agentUrl;
+            button.dataset.toolName = tool.name;
+            button.textContent = 'Invoke Tool';
+
+            toolItem.appendChild(button);
+            fragment.appendChild(toolItem);
+        }
+
+        airaToolsList.replaceChildren(fragment);
+    }
+});
@@ -13,9 +13,19 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import asyncio
-import json
+import atexit
+import orjson
+import threading
 import traceback
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, abort, current_app
+
+# MessagePack is optional; without it the A2A endpoint only speaks JSON
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
 
 # Import AIRA modules
 try:
@@ -24,7 +34,7 @@ try:
     from cognisphere_adk.aira.tools import (
         setup_aira_client,
         register_all_cognisphere_tools_with_aira,
-        aira_tools
+        get_aira_tools
     )
 except ImportError:
     try:
@@ -33,7 +43,7 @@ except ImportError:
         from aira.tools import (
             setup_aira_client,
             register_all_cognisphere_tools_with_aira,
-            aira_tools
+            get_aira_tools
         )
     except ImportError:
         # Add project root to path
@@ -44,55 +54,106 @@ except ImportError:
         from aira.tools import (
             setup_aira_client,
             register_all_cognisphere_tools_with_aira,
-            aira_tools
+            get_aira_tools
         )
 
 # Create Blueprint
 aira_bp = Blueprint('aira', __name__, url_prefix='/api/aira')
 
+# Pre-encoded A2A JSON-RPC error envelope; only the message is filled in per response
+_A2A_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","id":null,"error":{"code":-32000,"message":%b}}'
+_A2A_NOT_INITIALIZED = _A2A_ERROR_TEMPLATE % orjson.dumps("AIRA client not initialized")
 
-# Async helper function for Flask
-def run_async(coroutine, error_handler=None):
-    """Run an async function from a synchronous Flask route with detailed error handling."""
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+def _orjson_response(payload, status=200):
+    """Encode a (possibly large) JSON response body in one orjson call instead of jsonify."""
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def _ndjson_lines(items):
+    """Encode a list one item per line, so the response can be sent as it is encoded."""
+    for item in items:
+        yield orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+
+
+def _request_json():
+    """Parse the request body with orjson; invalid JSON or a non-object body is a 400."""
     try:
-        # Try to get the current event loop
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        # If there is no current event loop in this thread,
-        # create a new loop and set it as the current one
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        data = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        abort(400, description="Request body must be valid JSON")
+    if not isinstance(data, dict):
+        abort(400, description="Request body must be a JSON object")
+    return data
+
+
+# One long-lived event loop, running in its own thread, for every AIRA route.
+# The client's aiohttp session (and its pooled hub connections) and the heartbeat
+# task stay alive on it between requests instead of dying with a per-request loop.
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop():
+    """Return the AIRA event loop, starting its thread on first use."""
+    global _loop
+    # Started lazily so a pre-forking server doesn't start it in the parent process
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                # The loop is private to the AIRA routes, so it can use the eager
+                # task factory (Python 3.12+): tasks that finish without suspending
+                # skip the scheduling round trip
+                if hasattr(asyncio, "eager_task_factory"):
+                    loop.set_task_factory(asyncio.eager_task_factory)
+                threading.Thread(target=loop.run_forever, name="aira-event-loop", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def _shutdown_loop():
+    """Close the AIRA client's session and stop the event loop at interpreter exit."""
+    if _loop is None:
+        return
+    if aira_client:
+        try:
+            asyncio.run_coroutine_threadsafe(aira_client.stop(), _loop).result(timeout=5)
+        except Exception as e:
+            print(f"Error stopping AIRA client at exit: {e}")
+    _loop.call_soon_threadsafe(_loop.stop)
+
+
+atexit.register(_shutdown_loop)
 
+
+# Async helper function for Flask
+def run_async(coroutine, error_handler=None):
+    """Run an async function on the AIRA event loop from a synchronous Flask route."""
     try:
-        # Add task wrapper for proper timeout handling
-        async def run_with_timeout():
-            try:
-                return await coroutine
-            except Exception as e:
-                if error_handler:
-                    return error_handler(e)
-                raise
-
-        return loop.run_until_complete(run_with_timeout())
+        return asyncio.run_coroutine_threadsafe(coroutine, _get_loop()).result()
     except Exception as e:
         print(f"Unhandled exception in run_async: {e}")
         traceback.print_exc()
         if error_handler:
             return error_handler(e)
         raise
-    finally:
-        # Clean up tasks but don't close the loop
-        pending = asyncio.all_tasks(loop)
-        for task in pending:
-            task.cancel()
-
-        if loop.is_running():
-            loop.stop()
 
 
 # Initialize AIRA client
 aira_client = None
 
+# (agent card, encoded card) for /.well-known/agent.json. The client builds a new
+# card dict whenever the card changes, so the bytes are reused while it is the same object
+_agent_card_cache = None
+
 
 # ========== AIRA Hub Management Routes ==========
 
@@ -101,18 +162,24 @@ def connect_hub():
     """Connect to an AIRA hub."""
     global aira_client
     print("Received AIRA hub connection request")
-    data = request.json
+    data = _request_json()
     hub_url = data.get('hub_url')
     agent_url = data.get('agent_url')
     agent_name = data.get('agent_name', 'Cognisphere')
     print(f"Connection parameters: hub_url={hub_url}, agent_url={agent_url}, agent_name={agent_name}")
     if not hub_url or not agent_url:
         print("Missing required parameters")
-        return jsonify({
+        return _orjson_response({
             "error": "Missing required parameters: hub_url and agent_url are required"
-        }), 400
+        }, 400)
 
     try:
+        # Close the previous client's session and heartbeat before replacing it,
+        # so reconnecting doesn't leave its connection pool open
+        if aira_client:
+            run_async(aira_client.stop())
+            aira_client = None
+
         print("Initializing AIRA client...")
         # Initialize AIRA client
         aira_client = setup_aira_client(hub_url, agent_url, agent_name)
@@ -125,9 +192,9 @@ def connect_hub():
         print("Registering Cognisphere tools with AIRA...")
         # Register AIRA tools with ADK's global orchestrator agent
         if hasattr(current_app, 'orchestrator_agent'):
-            current_app.orchestrator_agent.tools.extend(aira_tools)
+            current_app.orchestrator_agent.tools.extend(get_aira_tools())
         print("AIRA connection successful")
-        return jsonify({
+        return _orjson_response({
             "status": "success",
             "message": f"Connected to AIRA hub at {hub_url}",
             "hub_url": hub_url,
@@ -135,9 +202,9 @@ def connect_hub():
         })
     except Exception as e:
         traceback.print_exc()
-        return jsonify({
+        return _orjson_response({
             "error": f"Failed to connect to AIRA hub: {str(e)}"
-        }), 500
+        }, 500)
 
 
 @aira_bp.route('/disconnect', methods=['POST'])
@@ -146,9 +213,9 @@ def disconnect_hub():
     global aira_client
 
     if not aira_client:
-        return jsonify({
+        return _orjson_response({
             "error": "Not connected to any AIRA hub"
-        }), 400
+        }, 400)
 
     try:
         # Clean up client resources
@@ -160,18 +227,18 @@ def disconnect_hub():
         if hasattr(current_app, 'orchestrator_agent'):
             current_app.orchestrator_agent.tools = [
                 t for t in current_app.orchestrator_agent.tools
-                if t not in aira_tools
+                if t not in get_aira_tools()
             ]
 
-        return jsonify({
+        return _orjson_response({
             "status": "success",
             "message": f"Disconnected from AIRA hub at {hub_url}"
         })
     except Exception as e:
         traceback.print_exc()
-        return jsonify({
+        return _orjson_response({
             "error": f"Failed to disconnect from AIRA hub: {str(e)}"
-        }), 500
+        }, 500)
 
 
 @aira_bp.route('/status', methods=['GET'])
@@ -180,12 +247,12 @@ def hub_status():
     global aira_client
 
     if not aira_client:
-        return jsonify({
+        return _orjson_response({
             "status": "disconnected",
             "connected": False
         })
 
-    return jsonify({
+    return _orjson_response({
         "status": "connected" if aira_client.registered else "connecting",
         "connected": aira_client.registered,
         "hub_url": aira_client.hub_url,
@@ -200,22 +267,22 @@ def get_hubs():
     global aira_client
 
     if not aira_client:
-        return jsonify({
+        return _orjson_response({
             "error": "Not connected to any AIRA hub"
-        }), 400
+        }, 400)
 
     try:
         hubs = run_async(aira_client.get_available_hubs())
-        return jsonify({
+        return _orjson_response({
             "status": "success",
             "hubs": hubs,
             "current_hub": aira_client.hub_url
         })
     except Exception as e:
         traceback.print_exc()
-        return jsonify({
+        return _orjson_response({
             "error": f"Failed to get AIRA hubs: {str(e)}"
-        }), 500
+        }, 500)
 
 
 @aira_bp.route('/switch-hub', methods=['POST'])
@@ -223,31 +290,31 @@ def switch_hub():
     """Switch to a different AIRA hub."""
     global aira_client
 
-    data = request.json
+    data = _request_json()
     hub_url = data.get('hub_url')
 
     if not hub_url:
-        return jsonify({
+        return _orjson_response({
             "error": "Missing required parameter: hub_url"
-        }), 400
+        }, 400)
 
     if not aira_client:
-        return jsonify({
+        return _orjson_response({
             "error": "Not connected to any AIRA hub"
-        }), 400
+        }, 400)
 
     try:
         run_async(aira_client.switch_hub(hub_url))
-        return jsonify({
+        return _orjson_response({
             "status": "success",
             "message": f"Switched to AIRA hub at {hub_url}",
             "new_hub": hub_url
         })
     except Exception as e:
         traceback.print_exc()
-        return jsonify({
+        return _orjson_response({
             "error": f"Failed to switch hub: {str(e)}"
-        }), 500
+        }, 500)
 
 
 # ========== AIRA Discovery Routes ==========
@@ -256,18 +323,18 @@ def switch_hub():
 def discover_agents():
     global aira_client
     if not aira_client:
-        return jsonify({"error": "Not connected", "agents": []}), 400
+        return _orjson_response({"error": "Not connected", "agents": []}, 400)
     try:
         agents = run_async(aira_client.discover_agents())
-        return jsonify({"status": "success", "count": len(agents), "agents": agents})
+        return _orjson_response({"status": "success", "count": len(agents), "agents": agents})
     except Exception as e:
         print(f"Error in /api/aira/discover/agents: {e}")
         traceback.print_exc()
-        return jsonify({
+        return _orjson_response({
             "error": f"Failed to discover agents: {str(e)}",
             "detail": traceback.format_exc(),
             "agents": []
-        }), 500
+        }, 500)
 
 @aira_bp.route('/discover/tools', methods=['GET'])
 def discover_tools():
@@ -277,18 +344,18 @@ def discover_tools():
     agent_url = request.args.get('agent_url')
 
     if not agent_url:
-        return jsonify({
+        return _orjson_response({
             "error": "Missing required parameter: agent_url"
-        }), 400
+        }, 400)
 
     if not aira_client:
-        return jsonify({
+        return _orjson_response({
             "error": "Not connected to any AIRA hub"
-        }), 400
+        }, 400)
 
     try:
         tools = run_async(aira_client.discover_agent_tools(agent_url))
-        return jsonify({
+        return _orjson_response({
             "status": "success",
             "agent_url": agent_url,
             "count": len(tools),
@@ -296,9 +363,48 @@ def discover_tools():
         })
     except Exception as e:
         traceback.print_exc()
-        return jsonify({
+        return _orjson_response({
+            "error": f"Failed to discover tools: {str(e)}"
+        }, 500)
+
+
+@aira_bp.route('/discover/tools-batch', methods=['POST'])
+def discover_tools_batch():
+    """Discover tools from several agents on the AIRA network in one request."""
+    data = _request_json()
+    agent_urls = data.get('agent_urls') or []
+
+    if not agent_urls:
+        return _orjson_response({
+            "error": "Missing required parameter: agent_urls"
+        }, 400)
+
+    if not aira_client:
+        return _orjson_response({
+            "error": "Not connected to any AIRA hub"
+        }, 400)
+
+    try:
+        # One coroutine on the AIRA loop queries all the agents concurrently
+        results = run_async(aira_client.discover_tools_for_agents(agent_urls))
+
+        agents = []
+        for agent_url, result in zip(agent_urls, results):
+            if isinstance(result, Exception):
+                agents.append({"agent_url": agent_url, "error": f"Failed to discover tools: {str(result)}"})
+            else:
+                agents.append({"agent_url": agent_url, "count": len(result), "tools": result})
+
+        return _orjson_response({
+            "status": "success",
+            "count": len(agents),
+            "agents": agents
+        })
+    except Exception as e:
+        traceback.print_exc()
+        return _orjson_response({
             "error": f"Failed to discover tools: {str(e)}"
-        }), 500
+        }, 500)
 
 
 @aira_bp.route('/invoke', methods=['POST'])
@@ -306,24 +412,30 @@ def invoke_tool():
     """Invoke a tool from an agent on the AIRA network."""
     global aira_client
 
-    data = request.json
+    data = _request_json()
     agent_url = data.get('agent_url')
     tool_name = data.get('tool_name')
     parameters = data.get('parameters', {})
 
     if not agent_url or not tool_name:
-        return jsonify({
+        return _orjson_response({
             "error": "Missing required parameters: agent_url and tool_name are required"
-        }), 400
+        }, 400)
 
     if not aira_client:
-        return jsonify({
+        return _orjson_response({
             "error": "Not connected to any AIRA hub"
-        }), 400
+        }, 400)
 
     try:
         result = run_async(aira_client.invoke_agent_tool(agent_url, tool_name, parameters))
-        return jsonify({
+
+        # Callers that accept NDJSON get list results streamed one item per line
+        if isinstance(result, list) and request.accept_mimetypes.best_match(
+                ['application/json', NDJSON_CONTENT_TYPE]) == NDJSON_CONTENT_TYPE:
+            return Response(_ndjson_lines(result), mimetype=NDJSON_CONTENT_TYPE)
+
+        return _orjson_response({
             "status": "success",
             "agent_url": agent_url,
             "tool_name": tool_name,
@@ -331,9 +443,9 @@ def invoke_tool():
         })
     except Exception as e:
         traceback.print_exc()
-        return jsonify({
+        return _orjson_response({
             "error": f"Failed to invoke tool: {str(e)}"
-        }), 500
+        }, 500)
 
 
 # ========== A2A Endpoint ==========
@@ -344,55 +456,64 @@ def a2a_endpoint():
     global aira_client
 
     if not aira_client:
-        return jsonify({
-            "jsonrpc": "2.0",
-            "id": None,
-            "error": {
-                "code": -32000,
-                "message": "AIRA client not initialized"
-            }
-        }), 400
+        return Response(_A2A_NOT_INITIALIZED, status=400, mimetype='application/json')
+
+    msgpack_request = request.mimetype == MSGPACK_CONTENT_TYPE
+    if msgpack_request and not HAS_MSGPACK:
+        return Response(
+            _A2A_ERROR_TEMPLATE % orjson.dumps("MessagePack requests are not supported"),
+            status=415,
+            mimetype='application/json'
+        )
 
     try:
-        # Get request body
-        request_body = request.data.decode('utf-8')
+        # Get raw request body; the client parses JSON bytes directly
+        request_body = request.get_data()
+        if msgpack_request:
+            request_body = msgpack.unpackb(request_body, raw=False)
 
         # Handle request through AIRA client
         response = run_async(aira_client.handle_a2a_request(request_body))
 
-        # Return response
-        return jsonify(response)
+        # Answer MessagePack peers in kind, and JSON peers that prefer it in Accept
+        if HAS_MSGPACK and (
+                msgpack_request
+                or request.accept_mimetypes.best_match(['application/json', MSGPACK_CONTENT_TYPE]) == MSGPACK_CONTENT_TYPE
+        ):
+            return Response(msgpack.packb(response, use_bin_type=True), mimetype=MSGPACK_CONTENT_TYPE)
+
+        # Return response, encoded with orjson rather than Flask's JSON provider
+        return _orjson_response(response)
     except Exception as e:
         traceback.print_exc()
-        return jsonify({
-            "jsonrpc": "2.0",
-            "id": None,
-            "error": {
-                "code": -32000,
-                "message": f"Error handling request: {str(e)}"
-            }
-        }), 500
+        return Response(
+            _A2A_ERROR_TEMPLATE % orjson.dumps(f"Error handling request: {str(e)}"),
+            status=500,
+            mimetype='application/json'
+        )
 
 
 @aira_bp.route('/.well-known/agent.json', methods=['GET'])
 def well_known_agent():
     """Serve the agent card for A2A discovery."""
-    global aira_client
+    global aira_client, _agent_card_cache
 
     if not aira_client:
-        return jsonify({
+        return _orjson_response({
             "error": "AIRA client not initialized"
-        }), 400
+        }, 400)
 
     try:
-        # Generate agent card
+        # Generate agent card, encoding it only when it has changed
         agent_card = aira_client._generate_agent_card()
-        return jsonify(agent_card)
+        if _agent_card_cache is None or _agent_card_cache[0] is not agent_card:
+            _agent_card_cache = (agent_card, orjson.dumps(agent_card))
+        return Response(_agent_card_cache[1], mimetype='application/json')
     except Exception as e:
         traceback.print_exc()
-        return jsonify({
+        return _orjson_response({
             "error": f"Failed to generate agent card: {str(e)}"
-        }), 500
+        }, 500)
 
 
 def register_aira_blueprint(app):